@@ -0,0 +1,232 @@
+"""
+Benchmark suite of the authenticated request hot path.
+
+    $ python benchmarks/run.py                          # run all cases
+    $ python benchmarks/run.py --mode raw -k token      # filter cases
+    $ python benchmarks/run.py --json baseline.json     # save results
+    $ python benchmarks/run.py --compare baseline.json  # flag regressions
+
+Cases run in two modes: 'raw' calls library functions directly,
+'request' drives views with RequestFactory requests. With --compare,
+the exit code is 1 if any case is slower than the baseline by more
+than --threshold.
+
+CI runs this script on the base branch too. Cases import private
+helpers inside their setup, and a case whose helpers are missing
+(e.g. renamed) is skipped rather than failing the whole run.
+"""
+import os, sys, json, timeit, argparse, platform, warnings
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import tests  # configures Django with the test settings
+import django, jwt
+from django.apps import apps
+from django.test import RequestFactory
+from django_jwt_extended import (
+    create_access_token,
+    create_refresh_token,
+    create_token_pair,
+    get_jwt_identity,
+    verify_jwt_in_request,
+)
+from tests.sample.views import user, RestAPIView
+
+# e.g. PyJWT's InsecureKeyLengthWarning for the short test SECRET_KEY
+warnings.simplefilter('ignore')
+
+CASES = {}
+
+
+def case(name, mode):
+    """Register a setup function returning the callable to time"""
+    def register(setup):
+        CASES[name] = (mode, setup)
+        return setup
+    return register
+
+
+def _fresh(request):
+    """Drop the per-request verification memo between iterations"""
+    def reset():
+        request.__dict__.pop('jwt', None)
+        return request
+    return reset
+
+
+def _requests():
+    factory = RequestFactory()
+    token = create_access_token('iml')
+    header = factory.get('/user', HTTP_AUTHORIZATION='Bearer ' + token)
+    cookie = factory.get('/user')
+    cookie.COOKIES = {'access_token': token}
+    return header, cookie, factory.get('/user')
+
+
+@case('create_access_token', 'raw')
+def _():
+    return lambda: create_access_token('iml')
+
+
+@case('create_refresh_token', 'raw')
+def _():
+    return lambda: create_refresh_token('iml')
+
+
+@case('issue_separate', 'raw')
+def _():
+    return lambda: (create_access_token('iml'), create_refresh_token('iml'))
+
+
+@case('issue_pair', 'raw')
+def _():
+    return lambda: create_token_pair('iml')
+
+
+def _extract(index):
+    from django_jwt_extended.tokens import _compile_extractor
+    config = apps.get_app_config('django_jwt_extended')
+    extract = _compile_extractor(False, config)
+    request = _requests()[index]
+    return lambda: extract(request)
+
+
+@case('extract_header', 'raw')
+def _():
+    return _extract(0)
+
+
+@case('extract_cookie', 'raw')
+def _():
+    return _extract(1)
+
+
+@case('extract_missing', 'raw')
+def _():
+    return _extract(2)
+
+
+@case('verify_header', 'raw')
+def _():
+    config = apps.get_app_config('django_jwt_extended')
+    header, _, _ = _requests()
+    return lambda: config.verifiers[False](header)
+
+
+@case('decode_token', 'raw')
+def _():
+    from django_jwt_extended.tokens import _decode_jwt_token
+    config = apps.get_app_config('django_jwt_extended')
+    token = create_access_token('iml')
+    return lambda: _decode_jwt_token(token, config)
+
+
+@case('find_request_method', 'raw')
+def _():
+    from django_jwt_extended.request import _compile_request_finder
+    find = _compile_request_finder(RestAPIView.get)
+    view, request = RestAPIView(), _requests()[0]
+    return lambda: find(view, request)
+
+
+@case('get_jwt_identity', 'raw')
+def _():
+    header, _, _ = _requests()
+    verify_jwt_in_request(header)
+    return lambda: get_jwt_identity(header)
+
+
+@case('jwt_required_header', 'request')
+def _():
+    reset = _fresh(_requests()[0])
+    return lambda: user(reset())
+
+
+@case('jwt_required_cookie', 'request')
+def _():
+    reset = _fresh(_requests()[1])
+    return lambda: user(reset())
+
+
+@case('jwt_required_missing', 'request')
+def _():
+    reset = _fresh(_requests()[2])
+    return lambda: user(reset())
+
+
+@case('drf_apiview_dispatch', 'request')
+def _():
+    view = RestAPIView.as_view()
+    reset = _fresh(_requests()[0])
+    return lambda: view(reset())
+
+
+def run(names, number, repeat):
+    results = {}
+    for name in names:
+        mode, setup = CASES[name]
+        try:
+            fn = setup()
+        except (ImportError, AttributeError) as e:
+            print(f'{name:<24} {mode:<8} skipped: {e}')
+            continue
+        best = min(timeit.repeat(fn, number=number, repeat=repeat))
+        results[name] = {'mode': mode, 'ns_per_op': best / number * 1e9}
+        print(f'{name:<24} {mode:<8} {results[name]["ns_per_op"]:12.0f} ns/op')
+    return results
+
+
+def compare(results, baseline, threshold):
+    regressions = []
+    print(f'\n{"case":<24} {"baseline":>12} {"current":>12} {"delta":>8}')
+    for name, result in results.items():
+        if name not in baseline:
+            continue
+        before = baseline[name]['ns_per_op']
+        after = result['ns_per_op']
+        delta = after / before - 1
+        flag = ''
+        if delta > threshold:
+            flag = '  REGRESSION'
+            regressions.append(name)
+        print(f'{name:<24} {before:12.0f} {after:12.0f} {delta:+8.1%}{flag}')
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--mode', choices=('raw', 'request'))
+    parser.add_argument('-k', dest='keyword', help='only cases containing this')
+    parser.add_argument('--number', type=int, default=2000)
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--json', help='write results to this file')
+    parser.add_argument('--compare', help='baseline results file')
+    parser.add_argument('--threshold', type=float, default=0.10)
+    args = parser.parse_args(argv)
+
+    names = [
+        name for name, (mode, _) in CASES.items()
+        if (args.mode is None or mode == args.mode)
+        and (args.keyword is None or args.keyword in name)
+    ]
+    results = run(names, args.number, args.repeat)
+
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump({
+                'meta': {
+                    'python': platform.python_version(),
+                    'django': django.get_version(),
+                    'pyjwt': jwt.__version__,
+                },
+                'results': results,
+            }, f, indent=2)
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)['results']
+        if compare(results, baseline, args.threshold):
+            return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
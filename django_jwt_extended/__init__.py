@@ -1,10 +1,25 @@
 import django
 from .decorators import jwt_required
+from .cookies import (
+    set_access_cookies,
+    set_refresh_cookies,
+    unset_jwt_cookies,
+)
 from .tokens import (
     create_access_token,
     create_refresh_token,
+    additional_claims_loader,
+    create_tokens_bulk,
+    create_token_pair,
+    refresh_token_pair,
     get_jwt,
     get_jwt_identity,
+    get_current_user,
+    user_lookup_loader,
+    invalidate_user,
+    revoke_token,
+    verify_jwt_in_request,
+    averify_jwt_in_request,
 )
 
 __AUTHOR__ = "IML"
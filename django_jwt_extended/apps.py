@@ -1,8 +1,15 @@
+import json
 from datetime import timedelta
 from django.apps import AppConfig
+from django.http import HttpResponse
 from django.conf import settings
+from django.utils.module_loading import import_string
+from .cache import TokenCache, UserCache
 from .config import ConfigParser
-from .exceptions import NotFoundSecretKey
+from .keys import load_keyring, index_segments, build_jwks
+from .revocation import RevocationList
+from .instrumentation import MetricsCollector
+from .exceptions import NotFoundSecretKey, InvalidRevocation, InvalidClock
 
 
 class DjangoJwtExtConfig(AppConfig):
@@ -18,13 +25,60 @@ class DjangoJwtExtConfig(AppConfig):
             if hasattr(settings, 'JWT_CONFIG')
             else {}
         )
-        self.jwt_algorithm = data.jwt_algorithm
+        self.keys, self.active_key = load_keyring(
+            data.keys, settings.SECRET_KEY
+        )
+        self.key_segments = index_segments(self.keys.values())
+        self.jwt_algorithm = self.active_key.algorithm
+        self.jwks_body, self.jwks_etag = build_jwks(self.keys.values())
+        self.jwks_cache_control = f'public, max-age={data.jwks_max_age}'
         self.token_location = data.token_location
+        self.max_token_length = data.max_token_length
         self.access_token_expires = data.access_token_expires
         self.refresh_token_expires = data.refresh_token_expires
+        self.profiles = data.profiles
+        self.compact_tokens = data.compact_tokens
+        self.omit_claims = data.omit_claims
         self.token_header_name = 'Authorization'
         self.access_token_cookie_name = data.access_token_cookie_name
         self.refresh_token_cookie_name = data.refresh_token_cookie_name
+        self.cookie_settings = {
+            refresh: self.compile_cookies(data.cookies, refresh)
+            for refresh in (False, True)
+        }
+        self.csrf_protect = (
+            data.cookies['cookie_csrf_protect']
+            and 'cookies' in self.token_location
+        )
+        self.csrf_header_name = data.cookies['csrf_header_name']
+        self.csrf_methods = data.cookies['csrf_methods']
+        self.leeway = data.leeway
+        self.clock = self.load_clock(data.clock)
+        self.sliding_refresh = data.sliding_refresh
+        self.token_cache = (
+            TokenCache(data.token_cache_size, data.token_cache_ttl)
+            if data.token_cache_size
+            else None
+        )
+        self.user_cache = (
+            UserCache(data.user_cache_size, data.user_cache_ttl)
+            if data.user_cache_size
+            else None
+        )
+        self.revocation = self.load_revocation(
+            data.revocation, self.clock, self.leeway
+        )
+        self.metrics = MetricsCollector() if data.metrics else None
+        if self.metrics is not None:
+            self.metrics.connect()
+
+        from .tokens import _compile_verifier, _verifier_key
+        # 프로필 선택은 요청마다 dict 조회 한 번
+        self.verifiers = {
+            _verifier_key(refresh, profile): _compile_verifier(refresh, self, profile)
+            for profile in self.profiles
+            for refresh in (False, True)
+        }
 
         self.jwt_not_found_msg = data.errors['JWT_NOT_FOUND_MSG']
         self.bearer_error_msg = data.errors['BEARER_ERROR_MSG']
@@ -33,4 +87,92 @@ class DjangoJwtExtConfig(AppConfig):
         self.invalid_token_type_msg = data.errors['INVALID_TOKEN_TYPE_MSG']
         self.token_type_not_found_msg = data.errors['TOKEN_TYPE_NOT_FOUND_MSG']
         self.invalid_nbf_msg = data.errors['INVALID_NBF_MSG']
+        self.revoked_token_msg = data.errors['REVOKED_TOKEN_MSG']
+        self.malformed_token_msg = data.errors['MALFORMED_TOKEN_MSG']
+        self.refresh_token_reused_msg = data.errors['REFRESH_TOKEN_REUSED_MSG']
+        self.fresh_token_required_msg = data.errors['FRESH_TOKEN_REQUIRED_MSG']
+        self.insufficient_scope_msg = data.errors['INSUFFICIENT_SCOPE_MSG']
+        self.missing_role_msg = data.errors['MISSING_ROLE_MSG']
+        self.user_not_found_msg = data.errors['USER_NOT_FOUND_MSG']
+        self.csrf_error_msg = data.errors['CSRF_ERROR_MSG']
+        self.invalid_issuer_msg = data.errors['INVALID_ISSUER_MSG']
+        self.invalid_audience_msg = data.errors['INVALID_AUDIENCE_MSG']
+        self.error_responses = self.serialize_errors(
+            data.errors, data.error_status
+        )
+
+    def error_response(self, error: str):
+        """Error response of an error message attribute name"""
+        body, status, authenticate = self.error_responses[error]
+        response = HttpResponse(
+            body, content_type='application/json', status=status
+        )
+        if authenticate is not None:
+            response['WWW-Authenticate'] = authenticate
+        return response
+
+    def compile_cookies(self, cookies: dict, refresh: bool):
+        """(token cookie, CSRF cookie, max_age, token attributes, CSRF attributes)"""
+        if refresh:
+            names = self.refresh_token_cookie_name, cookies['refresh_csrf_cookie_name']
+            path, expires = cookies['refresh_cookie_path'], self.refresh_token_expires
+        else:
+            names = self.access_token_cookie_name, cookies['access_csrf_cookie_name']
+            path, expires = cookies['access_cookie_path'], self.access_token_expires
+        attributes = {
+            'path': path,
+            'domain': cookies['cookie_domain'],
+            'secure': cookies['cookie_secure'],
+            'samesite': cookies['cookie_samesite'],
+        }
+        return (
+            *names,
+            int(expires.total_seconds()),
+            dict(attributes, httponly=True),
+            # CSRF 쿠키는 JavaScript가 읽어 헤더로 보냄
+            dict(attributes, httponly=False),
+        )
+
+    @staticmethod
+    def serialize_errors(errors: dict, error_status: dict):
+        """Serialize every error response once: {name: (body, status, authenticate)}"""
+        responses = {}
+        for error, msg in errors.items():
+            status = error_status[error]
+            if status != 401:
+                authenticate = None
+            elif error == 'JWT_NOT_FOUND_MSG':
+                authenticate = 'Bearer'
+            else:
+                authenticate = 'Bearer error="invalid_token"'
+            responses[error.lower()] = (
+                json.dumps(msg).encode(), status, authenticate
+            )
+        return responses
+
+    @staticmethod
+    def load_clock(clock):
+        if not isinstance(clock, str):
+            return clock
+        try:
+            return import_string(clock)
+        except ImportError:
+            raise InvalidClock(clock)
+
+    @staticmethod
+    def load_revocation(revocation, clock, leeway):
+        if revocation is None:
+            return None
+        try:
+            backend_class = import_string(revocation['backend'])
+        except ImportError:
+            raise InvalidRevocation('REVOCATION_BACKEND')
+        return RevocationList(
+            backend_class(**revocation['options']),
+            prefilter=revocation['prefilter'],
+            capacity=revocation['capacity'],
+            sync_interval=revocation['sync_interval'],
+            clock=clock,
+            leeway=leeway,
+        )
         
\ No newline at end of file
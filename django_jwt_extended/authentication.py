@@ -0,0 +1,76 @@
+from django.apps import apps
+from rest_framework import exceptions
+from rest_framework.authentication import BaseAuthentication
+from . import tokens
+from .tokens import _get_jwt_state, get_current_user
+
+
+class TokenUser:
+    """Stateless user of a token, when no user_lookup_loader is registered.
+
+    'pk' is the identity of the token, so DRF's UserRateThrottle
+    throttles per identity.
+    """
+    is_authenticated = True
+    is_anonymous = False
+
+    def __init__(self, payload: dict):
+        self.payload = payload
+        self.pk = self.id = payload.get('sub')
+
+    def __str__(self):
+        return f'TokenUser {self.pk}'
+
+
+class JWTAuthentication(BaseAuthentication):
+    """Django REST framework authentication of JWT access tokens.
+
+    Shares "request.jwt" with jwt_required and the middleware, so a
+    token is decoded once per request however many of them check it.
+    Requests without a token are left to the next authenticator.
+    Subclasses select a PROFILES entry with 'profile'.
+    """
+    refresh = False
+    profile = None
+
+    def authenticate(self, request):
+        django_request = request._request
+        state = _get_jwt_state(django_request)
+        payload, error = state.verify(
+            django_request, self.refresh, self.profile
+        )
+        if error == 'jwt_not_found_msg':
+            return None
+        if error is not None:
+            raise _api_exception(error)
+        state.payload = payload
+        state.profile = self.profile
+
+        if tokens._user_lookup is None:
+            return TokenUser(payload), payload
+        user = get_current_user(django_request)
+        if user is None:
+            raise _api_exception('user_not_found_msg')
+        return user, payload
+
+    def authenticate_header(self, request):
+        # 없으면 DRF가 401을 403으로 바꿈
+        return 'Bearer'
+
+
+class JWTRefreshAuthentication(JWTAuthentication):
+    """JWTAuthentication of refresh tokens"""
+    refresh = True
+
+
+def _api_exception(error: str):
+    """DRF exception with the configured body and status of an error"""
+    config = apps.get_app_config('django_jwt_extended')
+    status = config.error_responses[error][1]
+    exception = (
+        exceptions.AuthenticationFailed
+        if status == 401
+        else exceptions.PermissionDenied
+    )(getattr(config, error))
+    exception.status_code = status
+    return exception
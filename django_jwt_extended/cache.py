@@ -0,0 +1,127 @@
+import json
+import time
+from collections import OrderedDict
+from hashlib import sha256
+from threading import Lock
+
+
+class TokenCache:
+    """Bounded LRU cache of verified JWT payloads.
+
+    Entries are keyed by a digest of the raw token and
+    never outlive the 'exp' claim of the token itself.
+    """
+
+    def __init__(self, maxsize: int, ttl: int):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._data = OrderedDict()
+        self._lock = Lock()
+
+    @staticmethod
+    def _key(jwt_token: str):
+        return sha256(jwt_token.encode()).digest()
+
+    def get(self, jwt_token: str):
+        key = self._key(jwt_token)
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is not None:
+                payload, expires_at = entry
+                if expires_at > time.time():
+                    self._data.move_to_end(key)
+                    self.hits += 1
+                    return dict(payload)
+                del self._data[key]
+            self.misses += 1
+            return None
+
+    def set(self, jwt_token: str, payload: dict):
+        expires_at = time.time() + self.ttl
+        exp = payload.get('exp')
+        if isinstance(exp, (int, float)):
+            expires_at = min(expires_at, exp)
+        key = self._key(jwt_token)
+        with self._lock:
+            self._data[key] = (dict(payload), expires_at)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def info(self):
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'size': len(self._data),
+            'maxsize': self.maxsize,
+        }
+
+
+class UserCache:
+    """Bounded LRU cache of looked up users, keyed by identity.
+
+    Entries expire after 'ttl' seconds or when invalidated.
+    Cached users are shared by requests of the process, so
+    they should be treated as read-only.
+    """
+
+    def __init__(self, maxsize: int, ttl: int):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._data = OrderedDict()
+        self._lock = Lock()
+
+    @staticmethod
+    def _key(identity):
+        # identity는 JSON 직렬화 가능한 모든 값
+        return json.dumps(identity, sort_keys=True)
+
+    def get(self, identity):
+        key = self._key(identity)
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is not None:
+                user, expires_at = entry
+                if expires_at > time.time():
+                    self._data.move_to_end(key)
+                    self.hits += 1
+                    return user
+                del self._data[key]
+            self.misses += 1
+            return None
+
+    def set(self, identity, user):
+        key = self._key(identity)
+        with self._lock:
+            self._data[key] = (user, time.time() + self.ttl)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def invalidate(self, identity):
+        with self._lock:
+            self._data.pop(self._key(identity), None)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def info(self):
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'size': len(self._data),
+            'maxsize': self.maxsize,
+        }
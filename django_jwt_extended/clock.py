@@ -0,0 +1,24 @@
+import time
+
+
+def system_clock():
+    """Current Unix time, to the second (the default CLOCK)"""
+    return int(time.time())
+
+
+class FrozenClock:
+    """Clock that only moves when told to, for deterministic tests.
+
+        clock = FrozenClock(1700000000)
+        JWT_CONFIG = {'CLOCK': clock}
+        clock.tick(60)
+    """
+
+    def __init__(self, now: int):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+    def tick(self, seconds: int = 1):
+        self.now += seconds
@@ -1,17 +1,73 @@
 import json
 from datetime import timedelta
+from typing import NamedTuple, Optional
 from django.utils import timezone
 from django.apps import apps
+from jwt.algorithms import get_default_algorithms
+from jwt.exceptions import InvalidKeyError
 from .exceptions import (
     ConfigIsNotDict,
     InvalidJsonFormat,
     InvalidJwtAlgorithm,
     InvalidLocation,
     InvalidExpires,
+    InvalidTokenCache,
+    InvalidUserCache,
+    NotFoundKey,
+    InvalidKey,
+    MissingCryptography,
+    InvalidRevocation,
+    InvalidMetrics,
+    InvalidErrorStatus,
+    InvalidMaxTokenLength,
+    InvalidCompactTokens,
+    InvalidCookie,
+    InvalidSlidingRefresh,
+    InvalidLeeway,
+    InvalidClock,
+    InvalidProfile,
 )
 
-allowed_algorithm = ('HS256',)
+symmetric_algorithm = ('HS256', 'HS384', 'HS512',)
+asymmetric_algorithm = (
+    'RS256', 'RS384', 'RS512',
+    'PS256', 'PS384', 'PS512',
+    'ES256', 'ES384', 'ES512',
+    'EdDSA',
+)
+allowed_algorithm = symmetric_algorithm + asymmetric_algorithm
 allowed_location = ('headers', 'cookies',)
+allowed_samesite = ('Lax', 'Strict', 'None', None,)
+omittable_claims = ('iat', 'nbf', 'jti',)
+# authorization errors, every other error defaults to 401
+default_error_status = {'INSUFFICIENT_SCOPE_MSG': 403, 'MISSING_ROLE_MSG': 403}
+# claims set by the library, never overridden by additional claims
+registered_claims = frozenset((
+    'iat', 'jti', 'type', 'sub', 'nbf', 'exp', 'fresh', 'pjti', 'fam', 'csrf',
+    'iss', 'aud', 'oiat',
+))
+# token type -> 'type' claim of the compact profile
+compact_token_type = {'access': 'a', 'refresh': 'r'}
+# settings a PROFILES entry overrides
+profile_settings = (
+    'ISSUER', 'AUDIENCE', 'ACCESS_TOKEN_EXPIRES', 'REFRESH_TOKEN_EXPIRES',
+)
+
+
+class JwtProfile(NamedTuple):
+    """Issuance and validation settings of a profile, frozen at startup.
+
+    The default profile (name None) is JWT_CONFIG itself, every
+    PROFILES entry overrides some of its settings.
+    """
+    name: Optional[str]
+    issuer: Optional[str]
+    audience: Optional[frozenset]
+    # 'aud' claim of issued tokens: one audience as a "str"
+    audience_claim: object
+    access_token_expires: int
+    refresh_token_expires: int
+
 
 class ConfigParser:
 
@@ -20,11 +76,30 @@ class ConfigParser:
             raise ConfigIsNotDict()
         self.access_token_cookie_name = self.validate_access_token_cookie_name(config)
         self.refresh_token_cookie_name = self.validate_refresh_token_cookie_name(config)
+        self.cookies = self.validate_cookies(config)
         self.jwt_algorithm = self.validate_jwt_algorithm(config)
+        self.private_key = self.validate_private_key(config)
+        self.public_key = self.validate_public_key(config)
+        self.keys = self.validate_keys(config)
+        self.jwks_max_age = self.validate_jwks_max_age(config)
         self.token_location = self.validate_token_location(config)
+        self.max_token_length = self.validate_max_token_length(config)
         self.access_token_expires = self.validate_access_token_expires(config)
         self.refresh_token_expires = self.validate_refresh_token_expires(config)
+        self.profiles = self.validate_profiles(config)
+        self.leeway = self.validate_leeway(config)
+        self.clock = self.validate_clock(config)
+        self.sliding_refresh = self.validate_sliding_refresh(config)
+        self.token_cache_size = self.validate_token_cache_size(config)
+        self.token_cache_ttl = self.validate_token_cache_ttl(config)
+        self.user_cache_size = self.validate_user_cache_size(config)
+        self.user_cache_ttl = self.validate_user_cache_ttl(config)
+        self.revocation = self.validate_revocation(config)
+        self.compact_tokens = self.validate_compact_tokens(config)
+        self.omit_claims = self.validate_omit_claims(config, self.revocation)
+        self.metrics = self.validate_metrics(config)
         self.errors = self.customize_error(config)
+        self.error_status = self.validate_error_status(config, self.errors)
 
     @staticmethod
     def validate_access_token_cookie_name(config: dict):
@@ -36,6 +111,43 @@ class ConfigParser:
         refresh_cookie_name = config.get('REFRESH_TOKEN_COOKIE_NAME', 'refresh_token')
         return refresh_cookie_name
 
+    @staticmethod
+    def validate_cookies(config: dict):
+        """Attributes of the cookies set by set_access_cookies and co."""
+        cookies = {}
+        for key, default in (
+            ('COOKIE_SECURE', False),
+            ('COOKIE_CSRF_PROTECT', False),
+        ):
+            value = config.get(key, default)
+            if not isinstance(value, bool):
+                raise InvalidCookie(key, value)
+            cookies[key.lower()] = value
+        for key, default in (
+            ('COOKIE_DOMAIN', None),
+            ('ACCESS_COOKIE_PATH', '/'),
+            ('REFRESH_COOKIE_PATH', '/'),
+            ('ACCESS_CSRF_COOKIE_NAME', 'csrf_access_token'),
+            ('REFRESH_CSRF_COOKIE_NAME', 'csrf_refresh_token'),
+            ('CSRF_HEADER_NAME', 'X-CSRF-TOKEN'),
+        ):
+            value = config.get(key, default)
+            if not (isinstance(value, str) or value is default is None):
+                raise InvalidCookie(key, value)
+            cookies[key.lower()] = value
+        samesite = config.get('COOKIE_SAMESITE', 'Lax')
+        if samesite not in allowed_samesite:
+            raise InvalidCookie('COOKIE_SAMESITE', samesite)
+        cookies['cookie_samesite'] = samesite
+        methods = config.get('CSRF_METHODS', ['POST', 'PUT', 'PATCH', 'DELETE'])
+        if not (
+            isinstance(methods, list)
+            and all(isinstance(method, str) for method in methods)
+        ):
+            raise InvalidCookie('CSRF_METHODS', methods)
+        cookies['csrf_methods'] = frozenset(method.upper() for method in methods)
+        return cookies
+
     @staticmethod
     def validate_jwt_algorithm(config: dict):
         jwt_algorithm = config.get('ALGORITHM', 'HS256')
@@ -43,6 +155,67 @@ class ConfigParser:
             raise InvalidJwtAlgorithm(jwt_algorithm, allowed_algorithm)
         return jwt_algorithm
 
+    @staticmethod
+    def validate_private_key(config: dict):
+        private_key = config.get('PRIVATE_KEY')
+        if not (private_key is None or isinstance(private_key, (str, bytes))):
+            raise InvalidKey('PRIVATE_KEY')
+        return private_key
+
+    @staticmethod
+    def validate_public_key(config: dict):
+        public_key = config.get('PUBLIC_KEY')
+        if not (public_key is None or isinstance(public_key, (str, bytes))):
+            raise InvalidKey('PUBLIC_KEY')
+        return public_key
+
+    @staticmethod
+    def validate_keys(config: dict):
+        """Keyring entries, the first one signs new tokens.
+
+        Without 'KEYS', the single ALGORITHM/PRIVATE_KEY/PUBLIC_KEY
+        setting becomes a keyring of one key without 'kid'.
+        """
+        if 'KEYS' not in config:
+            return [{
+                'kid': None,
+                'algorithm': ConfigParser.validate_jwt_algorithm(config),
+                'secret': None,
+                'private_key': ConfigParser.validate_private_key(config),
+                'public_key': ConfigParser.validate_public_key(config),
+            }]
+
+        entries = config['KEYS']
+        if not (isinstance(entries, list) and entries):
+            raise InvalidKey('KEYS must be a non-empty "list"')
+        keys = []
+        for entry in entries:
+            if not (isinstance(entry, dict) and 'KID' in entry):
+                raise InvalidKey('each KEYS entry must be a "dict" with "KID"')
+            secret = entry.get('SECRET')
+            if not (secret is None or isinstance(secret, (str, bytes))):
+                raise InvalidKey('SECRET')
+            keys.append({
+                'kid': entry['KID'],
+                'algorithm': ConfigParser.validate_jwt_algorithm(entry),
+                'secret': secret,
+                'private_key': ConfigParser.validate_private_key(entry),
+                'public_key': ConfigParser.validate_public_key(entry),
+            })
+        kids = [key['kid'] for key in keys]
+        if len(set(kids)) != len(kids):
+            raise InvalidKey('duplicated KID in KEYS')
+        return keys
+
+    @staticmethod
+    def validate_jwks_max_age(config: dict):
+        max_age = config.get('JWKS_MAX_AGE', 3600)
+        if isinstance(max_age, timedelta):
+            max_age = int(max_age.total_seconds())
+        if not (isinstance(max_age, int) and max_age >= 0):
+            raise InvalidExpires('JWKS_MAX_AGE')
+        return max_age
+
     @staticmethod
     def validate_token_location(config: dict):
         token_location = config.get('LOCATION', ['headers', 'cookies'])
@@ -53,6 +226,13 @@ class ConfigParser:
             raise InvalidLocation(token_location, allowed_location)
         return token_location
 
+    @staticmethod
+    def validate_max_token_length(config: dict):
+        max_length = config.get('MAX_TOKEN_LENGTH', 8192)
+        if not (isinstance(max_length, int) and max_length > 0):
+            raise InvalidMaxTokenLength(max_length)
+        return max_length
+
     @staticmethod
     def validate_access_token_expires(config: dict):
         expires = config.get('ACCESS_TOKEN_EXPIRES', timedelta(days=2))
@@ -71,13 +251,200 @@ class ConfigParser:
             raise InvalidExpires('REFRESH_TOKEN')
         return expires
 
+    @staticmethod
+    def validate_issuer(config: dict):
+        issuer = config.get('ISSUER')
+        if not (issuer is None or isinstance(issuer, str)):
+            raise InvalidProfile('ISSUER', issuer)
+        return issuer
+
+    @staticmethod
+    def validate_audience(config: dict):
+        audience = config.get('AUDIENCE')
+        if audience is None:
+            return None
+        if isinstance(audience, str):
+            audience = [audience]
+        if not (
+            isinstance(audience, list)
+            and audience
+            and all(isinstance(item, str) for item in audience)
+        ):
+            raise InvalidProfile('AUDIENCE', audience)
+        return tuple(audience)
+
+    @staticmethod
+    def validate_profile(name, config: dict):
+        audience = ConfigParser.validate_audience(config)
+        return JwtProfile(
+            name=name,
+            issuer=ConfigParser.validate_issuer(config),
+            audience=frozenset(audience) if audience else None,
+            audience_claim=(
+                audience[0] if audience and len(audience) == 1 else audience
+            ),
+            access_token_expires=int(
+                ConfigParser.validate_access_token_expires(config).total_seconds()
+            ),
+            refresh_token_expires=int(
+                ConfigParser.validate_refresh_token_expires(config).total_seconds()
+            ),
+        )
+
+    @staticmethod
+    def validate_profiles(config: dict):
+        """{name: JwtProfile}, None being the default profile"""
+        entries = config.get('PROFILES', {})
+        if not isinstance(entries, dict):
+            raise InvalidProfile('PROFILES', entries)
+        profiles = {None: ConfigParser.validate_profile(None, config)}
+        for name, entry in entries.items():
+            if not (isinstance(name, str) and name and isinstance(entry, dict)):
+                raise InvalidProfile('PROFILES', name)
+            unknown = set(entry) - set(profile_settings)
+            if unknown:
+                raise InvalidProfile(name, sorted(unknown))
+            profiles[name] = ConfigParser.validate_profile(
+                name, {**config, **entry}
+            )
+        return profiles
+
+    @staticmethod
+    def validate_leeway(config: dict):
+        leeway = config.get('LEEWAY', 0)
+        if isinstance(leeway, timedelta):
+            leeway = int(leeway.total_seconds())
+        if not (
+            isinstance(leeway, int)
+            and not isinstance(leeway, bool)
+            and leeway >= 0
+        ):
+            raise InvalidLeeway(leeway)
+        return leeway
+
+    @staticmethod
+    def validate_clock(config: dict):
+        clock = config.get('CLOCK', 'django_jwt_extended.clock.system_clock')
+        if not (isinstance(clock, str) or callable(clock)):
+            raise InvalidClock(clock)
+        return clock
+
+    @staticmethod
+    def validate_sliding_refresh(config: dict):
+        window = config.get('SLIDING_REFRESH_WINDOW')
+        if window is None:
+            return None
+        if isinstance(window, timedelta):
+            window = int(window.total_seconds())
+        if not (
+            isinstance(window, int)
+            and not isinstance(window, bool)
+            and window > 0
+        ):
+            raise InvalidSlidingRefresh('SLIDING_REFRESH_WINDOW', window)
+        location = config.get('SLIDING_REFRESH_LOCATION', 'headers')
+        if location not in allowed_location:
+            raise InvalidSlidingRefresh('SLIDING_REFRESH_LOCATION', location)
+        header = config.get('SLIDING_REFRESH_HEADER', 'X-Access-Token')
+        if not isinstance(header, str):
+            raise InvalidSlidingRefresh('SLIDING_REFRESH_HEADER', header)
+        return {'window': window, 'location': location, 'header': header}
+
+    @staticmethod
+    def validate_token_cache_size(config: dict):
+        size = config.get('TOKEN_CACHE_SIZE', 0)
+        if not (isinstance(size, int) and size >= 0):
+            raise InvalidTokenCache('TOKEN_CACHE_SIZE')
+        return size
+
+    @staticmethod
+    def validate_token_cache_ttl(config: dict):
+        ttl = config.get('TOKEN_CACHE_TTL', 300)
+        if isinstance(ttl, timedelta):
+            ttl = int(ttl.total_seconds())
+        if not (isinstance(ttl, int) and ttl > 0):
+            raise InvalidTokenCache('TOKEN_CACHE_TTL')
+        return ttl
+
+    @staticmethod
+    def validate_user_cache_size(config: dict):
+        size = config.get('USER_CACHE_SIZE', 0)
+        if not (isinstance(size, int) and size >= 0):
+            raise InvalidUserCache('USER_CACHE_SIZE')
+        return size
+
+    @staticmethod
+    def validate_user_cache_ttl(config: dict):
+        ttl = config.get('USER_CACHE_TTL', 60)
+        if isinstance(ttl, timedelta):
+            ttl = int(ttl.total_seconds())
+        if not (isinstance(ttl, int) and ttl > 0):
+            raise InvalidUserCache('USER_CACHE_TTL')
+        return ttl
+
+    @staticmethod
+    def validate_revocation(config: dict):
+        backend = config.get('REVOCATION_BACKEND')
+        if backend is None:
+            return None
+        if not isinstance(backend, str):
+            raise InvalidRevocation('REVOCATION_BACKEND')
+        options = config.get('REVOCATION_OPTIONS', {})
+        if not isinstance(options, dict):
+            raise InvalidRevocation('REVOCATION_OPTIONS')
+        prefilter = config.get('REVOCATION_PREFILTER', True)
+        if not isinstance(prefilter, bool):
+            raise InvalidRevocation('REVOCATION_PREFILTER')
+        capacity = config.get('REVOCATION_PREFILTER_CAPACITY', 100000)
+        if not (isinstance(capacity, int) and capacity > 0):
+            raise InvalidRevocation('REVOCATION_PREFILTER_CAPACITY')
+        sync_interval = config.get('REVOCATION_SYNC_INTERVAL', 5)
+        if not (isinstance(sync_interval, (int, float)) and sync_interval >= 0):
+            raise InvalidRevocation('REVOCATION_SYNC_INTERVAL')
+        return {
+            'backend': backend,
+            'options': options,
+            'prefilter': prefilter,
+            'capacity': capacity,
+            'sync_interval': sync_interval,
+        }
+
+    @staticmethod
+    def validate_compact_tokens(config: dict):
+        compact = config.get('COMPACT_TOKENS', False)
+        if not isinstance(compact, bool):
+            raise InvalidCompactTokens(
+                'COMPACT_TOKENS', compact, omittable_claims
+            )
+        return compact
+
+    @staticmethod
+    def validate_omit_claims(config: dict, revocation):
+        claims = config.get('OMIT_CLAIMS', [])
+        if not (
+            isinstance(claims, list)
+            and not (set(claims) - set(omittable_claims))
+        ):
+            raise InvalidCompactTokens('OMIT_CLAIMS', claims, omittable_claims)
+        if 'jti' in claims and revocation is not None:
+            # 폐기는 jti로 이루어짐
+            raise InvalidCompactTokens('OMIT_CLAIMS', claims, omittable_claims)
+        return tuple(claims)
+
+    @staticmethod
+    def validate_metrics(config: dict):
+        metrics = config.get('METRICS', False)
+        if not isinstance(metrics, bool):
+            raise InvalidMetrics(str(type(metrics)))
+        return metrics
+
     @staticmethod
     def customize_error(config: dict):
 
         def validate_json(data: dict):
             try:
                 json.dumps(data)
-            except ValueError:
+            except (ValueError, TypeError):
                 return False
             return True
 
@@ -88,6 +455,16 @@ class ConfigParser:
             'INVALID_TOKEN_TYPE_MSG': {'msg': "Invalid JWT token type"},
             'TOKEN_TYPE_NOT_FOUND_MSG': {'msg': 'JWT Token type not found.'},
             'INVALID_NBF_MSG': {'msg': "The token is not yet valid (nbf)"},
+            'MALFORMED_TOKEN_MSG': {'msg': 'Malformed JWT token'},
+            'REVOKED_TOKEN_MSG': {'msg': 'JWT token has been revoked'},
+            'REFRESH_TOKEN_REUSED_MSG': {'msg': 'Refresh token has already been used'},
+            'FRESH_TOKEN_REQUIRED_MSG': {'msg': 'Fresh token required'},
+            'INSUFFICIENT_SCOPE_MSG': {'msg': 'Insufficient scope'},
+            'MISSING_ROLE_MSG': {'msg': 'Missing required role'},
+            'USER_NOT_FOUND_MSG': {'msg': 'User not found'},
+            'CSRF_ERROR_MSG': {'msg': 'Missing or invalid CSRF token'},
+            'INVALID_ISSUER_MSG': {'msg': 'Invalid JWT issuer'},
+            'INVALID_AUDIENCE_MSG': {'msg': 'Invalid JWT audience'},
             'BEARER_ERROR_MSG': {
                 'msg':(
                         f"Missing 'Bearer' type in "
@@ -107,3 +484,52 @@ class ConfigParser:
             customized_error[error] = target
 
         return customized_error
+
+    @staticmethod
+    def validate_error_status(config: dict, errors: dict):
+        status = config.get('ERROR_STATUS_CODES', {})
+        if not isinstance(status, dict):
+            raise InvalidErrorStatus('ERROR_STATUS_CODES', status)
+        for error, code in status.items():
+            if error not in errors:
+                raise InvalidErrorStatus(error, code)
+            if not (isinstance(code, int) and 400 <= code < 600):
+                raise InvalidErrorStatus(error, code)
+        return {
+            error: status.get(error, default_error_status.get(error, 401))
+            for error in errors
+        }
+
+
+def load_keys(algorithm: str, secret_key, private_key=None, public_key=None):
+    """Parse key material once into (signing_key, verifying_key).
+
+    HMAC algorithms sign and verify with the Django SECRET_KEY.
+    Asymmetric algorithms parse the PEM keys into key objects,
+    so no request re-parses them. A verify-only node may omit
+    the private key, in which case signing_key is None.
+    """
+    if algorithm in symmetric_algorithm:
+        return secret_key, secret_key
+
+    algorithms = get_default_algorithms()
+    if algorithm not in algorithms:
+        raise MissingCryptography(algorithm)
+    if private_key is None and public_key is None:
+        raise NotFoundKey(algorithm)
+
+    algo = algorithms[algorithm]
+    try:
+        signing_key = (
+            algo.prepare_key(private_key)
+            if private_key is not None
+            else None
+        )
+        verifying_key = (
+            algo.prepare_key(public_key)
+            if public_key is not None
+            else signing_key.public_key()
+        )
+    except (InvalidKeyError, ValueError, TypeError) as e:
+        raise InvalidKey(str(e))
+    return signing_key, verifying_key
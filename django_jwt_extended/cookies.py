@@ -0,0 +1,58 @@
+import json
+from django.apps import apps
+from jwt.utils import base64url_decode
+
+
+def set_access_cookies(response, access_token: str, max_age=None):
+    """Set the access token cookie, and its CSRF cookie if protected.
+
+    Cookie attributes come from JWT_CONFIG, resolved once at startup.
+    'max_age' defaults to ACCESS_TOKEN_EXPIRES.
+    """
+    _set_cookies(response, access_token, False, max_age)
+    return response
+
+
+def set_refresh_cookies(response, refresh_token: str, max_age=None):
+    """Set the refresh token cookie, and its CSRF cookie if protected"""
+    _set_cookies(response, refresh_token, True, max_age)
+    return response
+
+
+def unset_jwt_cookies(response):
+    """Delete every token and CSRF cookie"""
+    config = apps.get_app_config('django_jwt_extended')
+    for name, csrf_name, _, attributes, _ in config.cookie_settings.values():
+        for cookie in (name, csrf_name):
+            response.delete_cookie(
+                cookie,
+                path=attributes['path'],
+                domain=attributes['domain'],
+                samesite=attributes['samesite'],
+            )
+    return response
+
+
+def _set_cookies(response, jwt_token: str, refresh: bool, max_age=None):
+    config = apps.get_app_config('django_jwt_extended')
+    name, csrf_name, default_max_age, attributes, csrf_attributes = (
+        config.cookie_settings[refresh]
+    )
+    if max_age is None:
+        max_age = default_max_age
+    response.set_cookie(name, jwt_token, max_age=max_age, **attributes)
+    if config.csrf_protect:
+        csrf = _csrf_claim(jwt_token)
+        if csrf is not None:
+            response.set_cookie(
+                csrf_name, csrf, max_age=max_age, **csrf_attributes
+            )
+
+
+def _csrf_claim(jwt_token: str):
+    """'csrf' claim of a token issued by this app (not verified)"""
+    try:
+        payload = json.loads(base64url_decode(jwt_token.split('.')[1]))
+    except (ValueError, TypeError, IndexError):
+        return None
+    return payload.get('csrf') if isinstance(payload, dict) else None
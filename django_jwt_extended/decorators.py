@@ -1,74 +1,101 @@
+import asyncio
 from functools import wraps
-from django.http import JsonResponse
-from django.conf import settings
 from django.apps import apps
-from .request import _find_request_object
-from .tokens import _find_jwt_token, _parse_jwt_token, _validate_payload
+from .request import _compile_request_finder
+from .tokens import _get_jwt_state, _compile_authorizer
 from .exceptions import (
 	NotFoundRequest,
 	InvalidOptional,
 	InvalidRefresh,
+	InvalidFresh,
+	InvalidScopes,
+	InvalidRoles,
+	InvalidProfile,
 )
-import jwt
-from jwt.exceptions import (
-	InvalidSignatureError,
-	ImmatureSignatureError,
-	ExpiredSignatureError,
-)
 
 
-def jwt_required(optional=False, refresh=False):
-	"""View decorator"""
+def _is_str_list(value):
+	return (
+		isinstance(value, (list, tuple, set, frozenset))
+		and all(isinstance(item, str) for item in value)
+	)
+
+
+def jwt_required(
+	optional=False, refresh=False, scopes=None, roles=None, fresh=False,
+	profile=None,
+):
+	"""View decorator (sync and async views).
+
+	'scopes' must all be in the 'scope' claim, at least one of
+	'roles' in the 'roles' claim, and with 'fresh' the token must
+	have been issued with create_access_token(fresh=...).
+	'profile' names the PROFILES entry whose issuer and audience
+	the token must match.
+	"""
 	if not isinstance(optional, bool):
 		raise InvalidOptional(str(type(optional)))
 	if not isinstance(refresh, bool):
 		raise InvalidRefresh(str(type(refresh)))
+	if not isinstance(fresh, bool):
+		raise InvalidFresh(str(type(fresh)))
+	if not (scopes is None or _is_str_list(scopes)):
+		raise InvalidScopes(str(scopes))
+	if not (roles is None or _is_str_list(roles)):
+		raise InvalidRoles(str(roles))
+	if not (profile is None or isinstance(profile, str)):
+		raise InvalidProfile('profile', profile)
+	if (
+		profile is not None
+		and apps.ready
+		and profile not in apps.get_app_config('django_jwt_extended').profiles
+	):
+		raise InvalidProfile('profile', profile)
+	# 요청마다 frozenset 포함 검사만 수행
+	authorize = _compile_authorizer(scopes, roles, fresh)
 
-	def wrapper(fn):
-		@wraps(fn)
-		def decorator(*args, **kwargs):
-			""""do something"""
-			request = _find_request_object(*args, **kwargs)
+	def find_state(fn, find_request, args, kwargs):
+		request = find_request(*args, **kwargs)
 
-			# Django Request 객체를 찾을 수 없을 경우
-			if request is None:
-				raise NotFoundRequest(fn.__name__)
-			config = apps.get_app_config('django_jwt_extended')
-			jwt_token, location = _find_jwt_token(request, refresh, config)
+		# Django Request 객체를 찾을 수 없을 경우
+		if request is None:
+			raise NotFoundRequest(fn.__name__)
+		# 미들웨어가 있다면 요청당 한 번만 디코딩
+		return request, _get_jwt_state(request)
 
-			# 토큰을 찾을 수 없을 경우
-			if not optional and jwt_token is None:
-				return JsonResponse(config.jwt_not_found_msg, status=401)
-			# 토큰을 찾을 수 없지만, optional인 경우
-			elif optional and jwt_token is None:
-				return fn(*args, **kwargs)
+	def check(state, payload, error):
+		"""Returns an error response, or None if the view may run."""
+		if error is None and authorize is not None:
+			error = authorize(payload)
+		if error is None:
+			state.payload = payload
+			state.profile = profile
+			return None
+		# 토큰을 찾을 수 없지만, optional인 경우
+		if optional and error == 'jwt_not_found_msg':
+			return None
+		config = apps.get_app_config('django_jwt_extended')
+		return config.error_response(error)
 
-			# header 토큰에 한하여, Bearer 포맷이 아닐 경우
-			jwt_token = _parse_jwt_token(jwt_token, location)
-			if jwt_token is None:
-				return JsonResponse(config.bearer_error_msg, status=401)
-
-			try:
-				payload = jwt.decode(
-					jwt_token, settings.SECRET_KEY,
-					config.jwt_algorithm,
-				)
-			except InvalidSignatureError:
-				return JsonResponse(config.decode_error_msg, status=401)
-			except ImmatureSignatureError:
-				return JsonResponse(config.invalid_nbf_msg, status=401)
-			except ExpiredSignatureError:
-				return JsonResponse(config.expired_token_msg, status=401)
-
-
-			# 토큰의 유효기간, 액세스/리프레시 검증
-			valid = _validate_payload(payload, 'refresh' if refresh else 'access')
-			if valid == 'type not found':
-				return JsonResponse(config.token_type_not_found_msg, status=401)
-			if valid == 'invalid type':
-				return JsonResponse(config.invalid_token_type_msg, status=401)
+	def wrapper(fn):
+		# 요청 객체의 위치는 데코레이션 시점에 한 번만 결정
+		find_request = _compile_request_finder(fn)
+		if asyncio.iscoroutinefunction(fn):
+			@wraps(fn)
+			async def async_decorator(*args, **kwargs):
+				request, state = find_state(fn, find_request, args, kwargs)
+				response = check(state, *(await state.averify(request, refresh, profile)))
+				if response is not None:
+					return response
+				return await fn(*args, **kwargs)
+			return async_decorator
 
-			request.META['jwt_payload'] = payload
+		@wraps(fn)
+		def decorator(*args, **kwargs):
+			request, state = find_state(fn, find_request, args, kwargs)
+			response = check(state, *state.verify(request, refresh, profile))
+			if response is not None:
+				return response
 			return fn(*args, **kwargs)
 		return decorator
 	return wrapper
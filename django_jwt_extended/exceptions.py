@@ -33,6 +33,51 @@ class InvalidJwtAlgorithm(Exception):
         )
 
 
+class NotFoundKey(Exception):
+
+    def __init__(self, algorithm: str):
+        self.algorithm = algorithm
+
+    def __str__(self):
+        return (
+            f'ALGORITHM "{self.algorithm}" requires "PRIVATE_KEY" '
+            f'or "PUBLIC_KEY" in JWT_CONFIG.'
+        )
+
+
+class NotFoundPrivateKey(Exception):
+
+    def __str__(self):
+        return (
+            'Cannot issue tokens without "PRIVATE_KEY". '
+            'This node is configured to verify tokens only.'
+        )
+
+
+class InvalidKey(Exception):
+
+    def __init__(self, param: str):
+        self.param = param
+
+    def __str__(self):
+        return (
+            f'Invalid JWT key: {self.param}. '
+            f'Keys must be PEM encoded "str" or "bytes".'
+        )
+
+
+class MissingCryptography(Exception):
+
+    def __init__(self, algorithm: str):
+        self.algorithm = algorithm
+
+    def __str__(self):
+        return (
+            f'ALGORITHM "{self.algorithm}" requires the "cryptography" package. '
+            f'Install it with "pip install django-jwt-extended[crypto]".'
+        )
+
+
 class InvalidLocation(Exception):
 
     def __init__(self, param: str, locations):
@@ -46,6 +91,33 @@ class InvalidLocation(Exception):
         )
 
 
+class InvalidMaxTokenLength(Exception):
+
+    def __init__(self, param):
+        self.param = param
+
+    def __str__(self):
+        return (
+            f'Invalid MAX_TOKEN_LENGTH "{self.param}". '
+            f'MAX_TOKEN_LENGTH must be an "int"(value > 0)'
+        )
+
+
+class InvalidCookie(Exception):
+
+    def __init__(self, target: str, param):
+        self.target = target
+        self.param = param
+
+    def __str__(self):
+        return (
+            f'Invalid {self.target} "{self.param}". '
+            f'COOKIE_SECURE and COOKIE_CSRF_PROTECT must be "bool", '
+            f'COOKIE_SAMESITE in ("Lax", "Strict", "None", None), '
+            f'paths, names and COOKIE_DOMAIN "str", and CSRF_METHODS a "list".'
+        )
+
+
 class InvalidExpires(Exception):
 
     def __init__(self, target: str):
@@ -58,6 +130,156 @@ class InvalidExpires(Exception):
         )
 
 
+class InvalidCompactTokens(Exception):
+
+    def __init__(self, target: str, param, claims):
+        self.target = target
+        self.param = param
+        self.claims = claims
+
+    def __str__(self):
+        return (
+            f'Invalid {self.target} "{self.param}". '
+            f'COMPACT_TOKENS must be "bool" and OMIT_CLAIMS a "list" '
+            f'in {self.claims}. "jti" can\'t be omitted '
+            f'with a REVOCATION_BACKEND.'
+        )
+
+
+class InvalidSlidingRefresh(Exception):
+
+    def __init__(self, target: str, param):
+        self.target = target
+        self.param = param
+
+    def __str__(self):
+        return (
+            f'Invalid {self.target} "{self.param}". '
+            f'SLIDING_REFRESH_WINDOW must be a "timedelta" or "int"(value > 0), '
+            f'SLIDING_REFRESH_LOCATION "headers" or "cookies" and '
+            f'SLIDING_REFRESH_HEADER a "str".'
+        )
+
+
+class InvalidLeeway(Exception):
+
+    def __init__(self, param):
+        self.param = param
+
+    def __str__(self):
+        return (
+            f'Invalid LEEWAY "{self.param}". '
+            f'LEEWAY must be a "timedelta" or "int"(value >= 0)'
+        )
+
+
+class InvalidClock(Exception):
+
+    def __init__(self, param):
+        self.param = param
+
+    def __str__(self):
+        return (
+            f'Invalid CLOCK "{self.param}". CLOCK must be a callable '
+            f'returning Unix time in seconds, or its importable dotted path.'
+        )
+
+
+class InvalidProfile(Exception):
+
+    def __init__(self, target: str, param):
+        self.target = target
+        self.param = param
+
+    def __str__(self):
+        return (
+            f'Invalid {self.target} "{self.param}". '
+            f'PROFILES must be a "dict" of names to "dict"s of ISSUER, '
+            f'AUDIENCE, ACCESS_TOKEN_EXPIRES and REFRESH_TOKEN_EXPIRES, '
+            f'ISSUER a "str", AUDIENCE a "str" or non-empty "list" of "str", '
+            f'and a selected profile one of the names of PROFILES.'
+        )
+
+
+class InvalidTokenCache(Exception):
+
+    def __init__(self, target: str):
+        self.target = target
+
+    def __str__(self):
+        return (
+            f'Invalid {self.target}. '
+            f'TOKEN_CACHE_SIZE must be an "int"(value >= 0) and '
+            f'TOKEN_CACHE_TTL a "timedelta" or "int"(value > 0)'
+        )
+
+
+class InvalidUserCache(Exception):
+
+    def __init__(self, target: str):
+        self.target = target
+
+    def __str__(self):
+        return (
+            f'Invalid {self.target}. '
+            f'USER_CACHE_SIZE must be an "int"(value >= 0) and '
+            f'USER_CACHE_TTL a "timedelta" or "int"(value > 0)'
+        )
+
+
+class UserLookupNotConfigured(Exception):
+
+    def __str__(self):
+        return (
+            'get_current_user requires a callback '
+            'registered with "user_lookup_loader".'
+        )
+
+
+class InvalidRevocation(Exception):
+
+    def __init__(self, target: str):
+        self.target = target
+
+    def __str__(self):
+        return (
+            f'Invalid {self.target}. '
+            f'REVOCATION_BACKEND must be an importable dotted path '
+            f'and REVOCATION_OPTIONS a "dict".'
+        )
+
+
+class RevocationNotConfigured(Exception):
+
+    def __str__(self):
+        return (
+            'Token revocation is disabled. '
+            'Set "REVOCATION_BACKEND" in JWT_CONFIG.'
+        )
+
+
+class InvalidMetrics(Exception):
+
+    def __init__(self, param: str):
+        self.param = param
+
+    def __str__(self):
+        return f"'METRICS' must be bool type, not {self.param}."
+
+
+class InvalidEvent(Exception):
+
+    def __init__(self, param: str, events):
+        self.param = param
+        self.events = events
+
+    def __str__(self):
+        return (
+            f'Invalid instrumentation event "{self.param}". '
+            f'Event must be in {self.events}.'
+        )
+
+
 class InvalidRequest(Exception):
 
     def __init__(self, param: str):
@@ -92,10 +314,97 @@ class InvalidRefresh(Exception):
         )
 
 
+class InvalidFresh(Exception):
+
+    def __init__(self, param: str):
+        self.param = param
+
+    def __str__(self):
+        return (
+            f"'fresh' param must be bool type, not {self.param}."
+        )
+
+
+class InvalidScopes(Exception):
+
+    def __init__(self, param: str):
+        self.param = param
+
+    def __str__(self):
+        return (
+            f"'scopes' param must be a list of str, not {self.param}."
+        )
+
+
+class InvalidRoles(Exception):
+
+    def __init__(self, param: str):
+        self.param = param
+
+    def __str__(self):
+        return (
+            f"'roles' param must be a list of str, not {self.param}."
+        )
+
+
+class InvalidTokenType(Exception):
+
+    def __init__(self, param: str):
+        self.param = param
+
+    def __str__(self):
+        return (
+            f"'type' param must be 'access' or 'refresh', not {self.param}."
+        )
+
+
+class ForkNotAvailable(Exception):
+
+    def __str__(self):
+        return (
+            "'processes' param requires the 'fork' start method, "
+            "workers inherit the configured Django app registry."
+        )
+
+
+class InvalidClaims(Exception):
+
+    def __init__(self, claims):
+        self.claims = claims
+
+    def __str__(self):
+        return (
+            f'Additional claims can\'t override registered claims {self.claims}.'
+        )
+
+
+class InvalidErrorStatus(Exception):
+
+    def __init__(self, error: str, code):
+        self.error = error
+        self.code = code
+
+    def __str__(self):
+        return (
+            f'Invalid ERROR_STATUS_CODES "{self.error}": {self.code}. '
+            f'It must map error names to "int" HTTP error codes (400~599).'
+        )
+
+
 class InvalidJsonFormat(Exception):
 
     def __str__(self):
         return (
             f"Invalid JSON format."
             f"Error config must be JSON serializable."
-        )
\ No newline at end of file
+        )
+
+
+class JwtVerificationError(Exception):
+
+    def __init__(self, msg: dict, status: int = 401):
+        self.msg = msg
+        self.status = status
+
+    def __str__(self):
+        return f"JWT verification failed: {self.msg}"
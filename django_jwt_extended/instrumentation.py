@@ -0,0 +1,149 @@
+from bisect import bisect_left
+from threading import Lock
+from .exceptions import InvalidEvent
+
+# event -> callbacks. Lists are mutated in place, so the hot path
+# keeps a reference and pays a single truthiness check when empty.
+_callbacks = {
+    'token_found': [],  # (location,)
+    'decoded': [],      # (duration in seconds,)
+    'verified': [],     # (outcome,)
+    'issued': [],       # (token type,)
+}
+
+# error message attribute of config -> outcome
+OUTCOMES = {
+    None: 'ok',
+    'jwt_not_found_msg': 'missing',
+    'bearer_error_msg': 'bearer',
+    'malformed_token_msg': 'malformed',
+    'decode_error_msg': 'bad_signature',
+    'invalid_nbf_msg': 'nbf',
+    'expired_token_msg': 'expired',
+    'token_type_not_found_msg': 'type_not_found',
+    'invalid_token_type_msg': 'wrong_type',
+    'revoked_token_msg': 'revoked',
+    'refresh_token_reused_msg': 'reused',
+    'csrf_error_msg': 'csrf',
+    'invalid_issuer_msg': 'issuer',
+    'invalid_audience_msg': 'audience',
+}
+
+
+def connect(event: str, callback):
+    if event not in _callbacks:
+        raise InvalidEvent(event, tuple(_callbacks))
+    _callbacks[event].append(callback)
+
+
+def disconnect(event: str, callback):
+    if event not in _callbacks:
+        raise InvalidEvent(event, tuple(_callbacks))
+    if callback in _callbacks[event]:
+        _callbacks[event].remove(callback)
+
+
+def emit(event: str, *args):
+    for callback in _callbacks[event]:
+        callback(*args)
+
+
+class Counter:
+    """Prometheus style counter, optionally with one label"""
+
+    def __init__(self, name: str, help: str, label=None):
+        self.name = name
+        self.help = help
+        self.label = label
+        self.values = {}
+        self._lock = Lock()
+
+    def inc(self, label_value=None, amount=1):
+        with self._lock:
+            self.values[label_value] = self.values.get(label_value, 0) + amount
+
+    def render(self):
+        lines = [
+            f'# HELP {self.name} {self.help}',
+            f'# TYPE {self.name} counter',
+        ]
+        for label_value, value in sorted(self.values.items(), key=str):
+            labels = (
+                f'{{{self.label}="{label_value}"}}'
+                if self.label is not None
+                else ''
+            )
+            lines.append(f'{self.name}{labels} {value}')
+        return lines
+
+
+class Histogram:
+    """Prometheus style histogram with fixed buckets"""
+
+    def __init__(self, name: str, help: str, buckets):
+        self.name = name
+        self.help = help
+        self.buckets = tuple(sorted(buckets))
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.sum = 0.0
+        self._lock = Lock()
+
+    def observe(self, value: float):
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            self.counts[index] += 1
+            self.sum += value
+
+    def render(self):
+        lines = [
+            f'# HELP {self.name} {self.help}',
+            f'# TYPE {self.name} histogram',
+        ]
+        cumulative = 0
+        for bound, count in zip(self.buckets + ('+Inf',), self.counts):
+            cumulative += count
+            lines.append(f'{self.name}_bucket{{le="{bound}"}} {cumulative}')
+        lines.append(f'{self.name}_sum {self.sum}')
+        lines.append(f'{self.name}_count {cumulative}')
+        return lines
+
+
+class MetricsCollector:
+    """In-process metrics of token verification and issuance"""
+
+    def __init__(self):
+        self.token_found = Counter(
+            'jwt_token_found_total', 'Tokens found, by location', 'location'
+        )
+        self.decode_seconds = Histogram(
+            'jwt_decode_seconds', 'Time spent decoding tokens',
+            (0.00001, 0.000025, 0.00005, 0.0001, 0.00025, 0.0005, 0.001, 0.005),
+        )
+        self.verified = Counter(
+            'jwt_verification_total', 'Verification outcomes', 'outcome'
+        )
+        self.issued = Counter(
+            'jwt_tokens_issued_total', 'Issued tokens, by type', 'type'
+        )
+        self._connections = (
+            ('token_found', self.token_found.inc),
+            ('decoded', self.decode_seconds.observe),
+            ('verified', self.verified.inc),
+            ('issued', self.issued.inc),
+        )
+
+    def connect(self):
+        for event, callback in self._connections:
+            connect(event, callback)
+
+    def disconnect(self):
+        for event, callback in self._connections:
+            disconnect(event, callback)
+
+    def render(self):
+        lines = []
+        for metric in (
+            self.token_found, self.decode_seconds, self.verified, self.issued,
+        ):
+            lines.extend(metric.render())
+        return '\n'.join(lines) + '\n'
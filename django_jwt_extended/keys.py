@@ -0,0 +1,113 @@
+import json
+from hashlib import sha256
+from jwt.algorithms import get_default_algorithms
+from jwt.utils import base64url_encode
+from .config import load_keys, symmetric_algorithm, compact_token_type
+from .exceptions import NotFoundPrivateKey
+from .instrumentation import _callbacks, emit
+
+_issued_callbacks = _callbacks['issued']
+_token_types = {code: type for type, code in compact_token_type.items()}
+
+
+class JwtKey:
+    """Parsed key of the keyring, indexed by its 'kid'.
+
+    The JOSE header segment is encoded and both keys are prepared
+    once, so issuing or verifying a token only touches its payload
+    and signature.
+    """
+    __slots__ = (
+        'kid', 'algorithm', 'signing_key', 'verifying_key',
+        'header_segment', '_algorithm', '_prepared_key',
+        '_prepared_verifying_key',
+    )
+
+    def __init__(self, kid, algorithm: str, signing_key, verifying_key):
+        self.kid = kid
+        self.algorithm = algorithm
+        self.signing_key = signing_key
+        self.verifying_key = verifying_key
+
+        header = {'alg': algorithm, 'typ': 'JWT'}
+        if kid is not None:
+            header['kid'] = kid
+        self.header_segment = base64url_encode(
+            json.dumps(header, separators=(',', ':'), sort_keys=True).encode()
+        )
+        self._algorithm = get_default_algorithms()[algorithm]
+        self._prepared_key = (
+            self._algorithm.prepare_key(signing_key)
+            if signing_key is not None
+            else None
+        )
+        self._prepared_verifying_key = self._algorithm.prepare_key(
+            verifying_key
+        )
+
+    def encode(self, payload: dict):
+        if self._prepared_key is None:
+            raise NotFoundPrivateKey()
+        signing_input = b'.'.join((
+            self.header_segment,
+            base64url_encode(
+                json.dumps(payload, separators=(',', ':')).encode()
+            ),
+        ))
+        signature = self._algorithm.sign(signing_input, self._prepared_key)
+        if _issued_callbacks:
+            type = payload.get('type')
+            emit('issued', _token_types.get(type, type))
+        return b'.'.join((signing_input, base64url_encode(signature))).decode()
+
+    def verify(self, signing_input: bytes, signature: bytes):
+        return self._algorithm.verify(
+            signing_input, self._prepared_verifying_key, signature
+        )
+
+
+def load_keyring(entries: list, secret_key):
+    """Returns ({kid: JwtKey}, active JwtKey) from ConfigParser.keys"""
+    keys = {}
+    for entry in entries:
+        signing_key, verifying_key = load_keys(
+            entry['algorithm'],
+            entry['secret'] if entry['secret'] is not None else secret_key,
+            entry['private_key'],
+            entry['public_key'],
+        )
+        keys[entry['kid']] = JwtKey(
+            entry['kid'], entry['algorithm'], signing_key, verifying_key
+        )
+    return keys, keys[entries[0]['kid']]
+
+
+def index_segments(keys):
+    """{JOSE header segment: JwtKey} of the keyring.
+
+    Tokens issued by the keyring carry one of these segments, so
+    their key is found without decoding the header.
+    """
+    return {key.header_segment.decode(): key for key in keys}
+
+
+def build_jwks(keys):
+    """Serialize the public keys of the keyring as a JWKS document.
+
+    HMAC secrets are never published. Returns (body, etag).
+    """
+    algorithms = get_default_algorithms()
+    jwks = []
+    for key in keys:
+        if key.algorithm in symmetric_algorithm:
+            continue
+        jwk = json.loads(
+            algorithms[key.algorithm].to_jwk(key.verifying_key)
+        )
+        jwk['alg'] = key.algorithm
+        jwk['use'] = 'sig'
+        if key.kid is not None:
+            jwk['kid'] = key.kid
+        jwks.append(jwk)
+    body = json.dumps({'keys': jwks}, separators=(',', ':')).encode()
+    return body, '"%s"' % sha256(body).hexdigest()[:32]
@@ -0,0 +1,93 @@
+import asyncio
+from django.apps import apps
+from .config import registered_claims
+from .cookies import set_access_cookies
+from .tokens import JwtState, _create_payload, _encode_payload
+try:
+    from asgiref.sync import markcoroutinefunction
+except ImportError:
+    # asgiref < 3.6
+    def markcoroutinefunction(func):
+        func._is_coroutine = asyncio.coroutines._is_coroutine
+        return func
+
+
+class JWTAuthenticationMiddleware:
+    """Attach a lazy "request.jwt" state to every request.
+
+    The token is decoded on first use and shared by every
+    jwt_required / get_jwt call made during the request.
+    With SLIDING_REFRESH_WINDOW, an accepted access token close
+    to its expiry is replaced by a new one on the response, for
+    at most REFRESH_TOKEN_EXPIRES after the login ('oiat' claim).
+    """
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.config = apps.get_app_config('django_jwt_extended')
+        self.async_mode = asyncio.iscoroutinefunction(get_response)
+        if self.async_mode:
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if self.async_mode:
+            return self.__acall__(request)
+        request.jwt = JwtState()
+        return self.slide(request, self.get_response(request))
+
+    async def __acall__(self, request):
+        request.jwt = JwtState()
+        return self.slide(request, await self.get_response(request))
+
+    def slide(self, request, response):
+        """Attach a new access token if the accepted one expires soon"""
+        sliding = self.config.sliding_refresh
+        if sliding is None:
+            return response
+        payload = request.jwt.payload
+        if (
+            payload is None
+            or payload.get('type') != 'access'
+            or response.status_code >= 400
+        ):
+            return response
+        exp = payload.get('exp')
+        now = self.config.clock()
+        if (
+            not isinstance(exp, (int, float))
+            or exp - now > sliding['window']
+        ):
+            return response
+        # 세션의 최초 발급 시각, 알 수 없으면 연장하지 않음
+        origin = payload.get('oiat', payload.get('iat'))
+        if not isinstance(origin, (int, float)):
+            return response
+        profile = request.jwt.profile
+        jwt_profile = self.config.profiles[profile]
+        expires = min(
+            jwt_profile.access_token_expires,
+            int(origin + jwt_profile.refresh_token_expires - now),
+        )
+        if now + expires <= exp:
+            return response
+
+        # 새 토큰은 fresh가 아니며, 사용자 정의 claim과 프로필은 유지.
+        # loader claim은 이전 토큰이 아닌 loader에서 다시 가져옴
+        new_payload = _create_payload(
+            payload.get('sub'), 'access', self.config, now,
+            expires_delta=expires,
+            profile=profile,
+            carried_claims={
+                claim: value for claim, value in payload.items()
+                if claim not in registered_claims
+            },
+        )
+        new_payload['oiat'] = origin
+        access_token = _encode_payload(new_payload, self.config)
+        if sliding['location'] == 'cookies':
+            set_access_cookies(response, access_token)
+        else:
+            response[sliding['header']] = access_token
+        return response
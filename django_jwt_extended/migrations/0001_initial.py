@@ -0,0 +1,25 @@
+# Generated by Django 5.2.18 on 2026-10-18 12:15
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='RevokedToken',
+            fields=[
+                ('id', models.BigAutoField(primary_key=True, serialize=False)),
+                ('jti', models.CharField(max_length=64, unique=True)),
+                ('expires_at', models.BigIntegerField(db_index=True)),
+            ],
+            options={
+                'db_table': 'django_jwt_extended_revoked_token',
+            },
+        ),
+    ]
@@ -0,0 +1,27 @@
+# Generated by Django 5.2.18 on 2026-10-18 12:16
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('django_jwt_extended', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='RefreshTokenFamily',
+            fields=[
+                ('id', models.BigAutoField(primary_key=True, serialize=False)),
+                ('family', models.CharField(max_length=64, unique=True)),
+                ('current_jti', models.CharField(max_length=64)),
+                ('access_jti', models.CharField(max_length=64, null=True)),
+                ('revoked', models.BooleanField(default=False)),
+                ('expires_at', models.BigIntegerField(db_index=True)),
+            ],
+            options={
+                'db_table': 'django_jwt_extended_refresh_token_family',
+            },
+        ),
+    ]
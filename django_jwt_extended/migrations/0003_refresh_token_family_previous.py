@@ -0,0 +1,21 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('django_jwt_extended', '0002_refresh_token_family'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='refreshtokenfamily',
+            name='previous_jti',
+            field=models.CharField(max_length=64, null=True),
+        ),
+        migrations.AddField(
+            model_name='refreshtokenfamily',
+            name='rotated_at',
+            field=models.BigIntegerField(null=True),
+        ),
+    ]
@@ -0,0 +1,34 @@
+from django.db import models
+
+
+class RevokedToken(models.Model):
+    """Revoked jti, used by DatabaseRevocationBackend"""
+    id = models.BigAutoField(primary_key=True)
+    jti = models.CharField(max_length=64, unique=True)
+    # 토큰의 exp (unix timestamp), 만료 후 정리 대상
+    expires_at = models.BigIntegerField(db_index=True)
+
+    class Meta:
+        db_table = 'django_jwt_extended_revoked_token'
+
+
+class RefreshTokenFamily(models.Model):
+    """Chain of rotated refresh tokens, used by refresh_token_pair.
+
+    Only the latest refresh jti of a family may be rotated.
+    Presenting any older one is reuse, and revokes the family,
+    unless it is the previous jti presented by a concurrent refresh.
+    """
+    id = models.BigAutoField(primary_key=True)
+    # 최초 refresh 토큰의 jti
+    family = models.CharField(max_length=64, unique=True)
+    current_jti = models.CharField(max_length=64)
+    previous_jti = models.CharField(max_length=64, null=True)
+    # 마지막 rotation 시각 (unix timestamp)
+    rotated_at = models.BigIntegerField(null=True)
+    access_jti = models.CharField(max_length=64, null=True)
+    revoked = models.BooleanField(default=False)
+    expires_at = models.BigIntegerField(db_index=True)
+
+    class Meta:
+        db_table = 'django_jwt_extended_refresh_token_family'
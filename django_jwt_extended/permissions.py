@@ -0,0 +1,34 @@
+from rest_framework.permissions import BasePermission
+from .tokens import _compile_authorizer
+from .authentication import _api_exception
+
+
+class HasClaims(BasePermission):
+    """Django REST framework permission of jwt_required's claim checks.
+
+    Reads 'jwt_scopes', 'jwt_roles' and 'jwt_fresh' of the view,
+    compiled once per view class. Requires JWTAuthentication.
+    """
+    _authorizers = {}
+
+    def has_permission(self, request, view):
+        state = getattr(request._request, 'jwt', None)
+        if state is None or state.payload is None:
+            return False
+        authorize = self._authorizer(type(view))
+        error = authorize(state.payload) if authorize is not None else None
+        if error is not None:
+            raise _api_exception(error)
+        return True
+
+    @classmethod
+    def _authorizer(cls, view_class):
+        try:
+            return cls._authorizers[view_class]
+        except KeyError:
+            authorize = cls._authorizers[view_class] = _compile_authorizer(
+                getattr(view_class, 'jwt_scopes', None),
+                getattr(view_class, 'jwt_roles', None),
+                getattr(view_class, 'jwt_fresh', False),
+            )
+            return authorize
@@ -1,3 +1,4 @@
+import inspect
 from .exceptions import NotFoundRequest
 from django.http import HttpRequest
 from django.core.handlers.asgi import ASGIRequest
@@ -12,9 +13,44 @@ except:
 
 def _find_request_object(*args, **kwargs):
     for object in args:
-        if any([isinstance(object, req) for req in REQUESTS]):
+        if isinstance(object, REQUESTS):
             return object
     for object in kwargs.values():
-        if any([isinstance(object, req) for req in REQUESTS]):
+        if isinstance(object, REQUESTS):
             return object
-    return None
\ No newline at end of file
+    return None
+
+
+def _compile_request_finder(fn):
+    """Locate the request argument of a view once, at decoration time.
+
+    The 'request' parameter, or else the first one of a function
+    and the one after 'self' of a method. Calls that don't match
+    the signature fall back to scanning every argument.
+    """
+    try:
+        parameters = inspect.signature(fn).parameters.values()
+    except (TypeError, ValueError):
+        return _find_request_object
+    names = [
+        parameter.name for parameter in parameters
+        if parameter.kind in (
+            parameter.POSITIONAL_ONLY, parameter.POSITIONAL_OR_KEYWORD
+        )
+    ]
+    if 'request' in names:
+        index = names.index('request')
+    elif len(names) > 1 and names[0] in ('self', 'cls'):
+        index = 1
+    elif names:
+        index = 0
+    else:
+        return _find_request_object
+    name = names[index]
+
+    def find(*args, **kwargs):
+        object = args[index] if len(args) > index else kwargs.get(name)
+        if isinstance(object, REQUESTS):
+            return object
+        return _find_request_object(*args, **kwargs)
+    return find
\ No newline at end of file
@@ -0,0 +1,233 @@
+import math
+import time
+from hashlib import blake2b
+from threading import Lock
+from asgiref.sync import sync_to_async
+from .clock import system_clock
+
+
+class BloomFilter:
+    """Fixed size Bloom filter of revoked jtis.
+
+    'jti in bloom' is False for every jti never added, so the
+    common (not revoked) case needs no backend round trip.
+    """
+
+    def __init__(self, capacity: int, error_rate: float):
+        self.capacity = capacity
+        self.size = max(8, int(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.hashes = max(1, round(self.size / capacity * math.log(2)))
+        self.count = 0
+        self._bits = bytearray((self.size + 7) // 8)
+
+    def _positions(self, jti: str):
+        digest = blake2b(jti.encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], 'little')
+        h2 = int.from_bytes(digest[8:], 'little') | 1
+        return [(h1 + i * h2) % self.size for i in range(self.hashes)]
+
+    def add(self, jti: str):
+        for position in self._positions(jti):
+            self._bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def __contains__(self, jti: str):
+        bits = self._bits
+        for position in self._positions(jti):
+            if not bits[position >> 3] & (1 << (position & 7)):
+                return False
+        return True
+
+
+class BaseRevocationBackend:
+    """Storage of revoked jtis.
+
+    'revoked_since' returns the jtis revoked after 'cursor'
+    (None for all of them) and the new cursor, so that the
+    prefilter of each node can be kept up to date incrementally.
+    Expiry is measured with 'clock', set to the configured CLOCK
+    by RevocationList.
+    """
+    clock = staticmethod(system_clock)
+
+    def revoke(self, jti: str, expires_at: int):
+        raise NotImplementedError
+
+    def is_revoked(self, jti: str):
+        raise NotImplementedError
+
+    def revoked_since(self, cursor):
+        raise NotImplementedError
+
+
+class LocalRevocationBackend(BaseRevocationBackend):
+    """In-process backend, for single process deployments and tests"""
+
+    def __init__(self):
+        self._revoked = {}
+        self._log = []
+        self._lock = Lock()
+
+    def revoke(self, jti: str, expires_at: int):
+        with self._lock:
+            self._revoked[jti] = expires_at
+            self._log.append(jti)
+
+    def is_revoked(self, jti: str):
+        expires_at = self._revoked.get(jti)
+        return expires_at is not None and expires_at > self.clock()
+
+    def revoked_since(self, cursor):
+        with self._lock:
+            if cursor is None:
+                now = self.clock()
+                self._revoked = {
+                    jti: expires_at
+                    for jti, expires_at in self._revoked.items()
+                    if expires_at > now
+                }
+                self._log = list(self._revoked)
+            cursor = cursor or 0
+            return self._log[cursor:], len(self._log)
+
+
+class CacheRevocationBackend(BaseRevocationBackend):
+    """Django cache framework backend (Redis, Memcached, locmem...)
+
+    Each revocation is a key living until the token expires,
+    plus a numbered slot (allocated with an atomic 'incr')
+    from which other nodes read new revocations.
+    """
+
+    def __init__(self, CACHE_ALIAS='default', KEY_PREFIX='jwt_revoked'):
+        from django.core.cache import caches
+        self.cache = caches[CACHE_ALIAS]
+        self.prefix = KEY_PREFIX
+        self.counter_key = f'{KEY_PREFIX}:count'
+
+    def revoke(self, jti: str, expires_at: int):
+        timeout = max(1, int(expires_at - self.clock()))
+        self.cache.set(f'{self.prefix}:jti:{jti}', 1, timeout)
+        self.cache.add(self.counter_key, 0, None)
+        slot = self.cache.incr(self.counter_key)
+        self.cache.set(f'{self.prefix}:slot:{slot}', jti, timeout)
+
+    def is_revoked(self, jti: str):
+        return self.cache.get(f'{self.prefix}:jti:{jti}') is not None
+
+    def revoked_since(self, cursor, batch=1000):
+        count = self.cache.get(self.counter_key) or 0
+        cursor = cursor or 0
+        if cursor > count:
+            # 카운터가 유실된 경우 처음부터 다시 읽음
+            cursor = 0
+        jtis = []
+        for start in range(cursor + 1, count + 1, batch):
+            keys = [
+                f'{self.prefix}:slot:{slot}'
+                for slot in range(start, min(start + batch, count + 1))
+            ]
+            jtis.extend(self.cache.get_many(keys).values())
+        return jtis, count
+
+
+class DatabaseRevocationBackend(BaseRevocationBackend):
+    """Database backend, needs the 'django_jwt_extended' migrations"""
+
+    def revoke(self, jti: str, expires_at: int):
+        from .models import RevokedToken
+        RevokedToken.objects.get_or_create(
+            jti=jti, defaults={'expires_at': expires_at}
+        )
+
+    def is_revoked(self, jti: str):
+        from .models import RevokedToken
+        return RevokedToken.objects.filter(
+            jti=jti, expires_at__gt=self.clock()
+        ).exists()
+
+    def revoked_since(self, cursor):
+        from .models import RevokedToken
+        rows = list(
+            RevokedToken.objects
+            .filter(id__gt=cursor or 0, expires_at__gt=self.clock())
+            .order_by('id')
+            .values_list('id', 'jti')
+        )
+        return [jti for _, jti in rows], rows[-1][0] if rows else cursor
+
+    def purge_expired(self):
+        from .models import RevokedToken
+        return RevokedToken.objects.filter(
+            expires_at__lte=self.clock()
+        ).delete()
+
+
+class RevocationList:
+    """Revocation backend behind an optional Bloom prefilter.
+
+    The prefilter pulls new revocations from the backend every
+    'sync_interval' seconds, which is how stale another node's
+    revocation may be on this one.
+
+    A revocation lasts until the token's 'exp' plus 'leeway', as
+    long as the token itself is accepted.
+    """
+
+    def __init__(
+        self, backend, prefilter=True, capacity=100000,
+        error_rate=0.001, sync_interval=5, clock=system_clock, leeway=0,
+    ):
+        self.backend = backend
+        self.backend.clock = clock
+        self.leeway = leeway
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.sync_interval = sync_interval
+        self.bloom = BloomFilter(capacity, error_rate) if prefilter else None
+        self._cursor = None
+        self._synced_at = 0
+        self._lock = Lock()
+
+    def revoke(self, jti: str, expires_at: int):
+        self.backend.revoke(jti, expires_at + self.leeway)
+        if self.bloom is not None:
+            with self._lock:
+                self.bloom.add(jti)
+
+    def is_revoked(self, jti: str):
+        if self.bloom is not None:
+            if self._sync_due():
+                self.sync()
+            if jti not in self.bloom:
+                return False
+        return self.backend.is_revoked(jti)
+
+    async def ais_revoked(self, jti: str):
+        # 프리필터만으로 판단 가능하면 스레드 전환 없이 반환
+        if (
+            self.bloom is not None
+            and not self._sync_due()
+            and jti not in self.bloom
+        ):
+            return False
+        return await sync_to_async(self.is_revoked)(jti)
+
+    def _sync_due(self):
+        return time.monotonic() - self._synced_at >= self.sync_interval
+
+    def sync(self):
+        with self._lock:
+            jtis, cursor = self.backend.revoked_since(self._cursor)
+            bloom = self.bloom
+            if bloom.count + len(jtis) > bloom.capacity:
+                # 용량을 넘으면 만료되지 않은 항목으로 다시 구성
+                jtis, cursor = self.backend.revoked_since(None)
+                bloom = BloomFilter(
+                    max(self.capacity, len(jtis) * 2), self.error_rate
+                )
+            for jti in jtis:
+                bloom.add(jti)
+            self.bloom = bloom
+            self._cursor = cursor
+            self._synced_at = time.monotonic()
@@ -0,0 +1,108 @@
+import time
+from django.db import IntegrityError, transaction
+from .models import RefreshTokenFamily
+
+# seconds a rotated refresh token is a concurrent refresh (e.g. two
+# tabs), rejected without revoking its family
+GRACE_PERIOD = 10
+
+
+def rotate(
+    family: str, old_jti: str, new_jti: str, access_jti: str,
+    expires_at: int, now=None,
+):
+    """Move a family from old_jti to new_jti at 'now'.
+
+    A single indexed write: the update only matches when old_jti is
+    the latest token of a live family, so concurrent rotations of
+    the same token have exactly one winner. Returns False otherwise.
+    """
+    if now is None:
+        now = int(time.time())
+    if family == old_jti:
+        # 첫 rotation: unique 제약으로 동시 요청 중 하나만 성공
+        try:
+            with transaction.atomic():
+                RefreshTokenFamily.objects.create(
+                    family=family,
+                    current_jti=new_jti,
+                    previous_jti=old_jti,
+                    rotated_at=now,
+                    access_jti=access_jti,
+                    expires_at=expires_at,
+                )
+            return True
+        except IntegrityError:
+            pass
+    return bool(
+        RefreshTokenFamily.objects
+        .filter(family=family, current_jti=old_jti, revoked=False)
+        .update(
+            current_jti=new_jti,
+            previous_jti=old_jti,
+            rotated_at=now,
+            access_jti=access_jti,
+            expires_at=expires_at,
+        )
+    )
+
+
+def revoke_family(family: str, revocation):
+    """Revoke a family and its latest refresh and access tokens"""
+    RefreshTokenFamily.objects.filter(family=family).update(revoked=True)
+    latest = (
+        RefreshTokenFamily.objects
+        .filter(family=family)
+        .values_list('current_jti', 'access_jti', 'expires_at')
+        .first()
+    )
+    if latest is not None:
+        current_jti, access_jti, expires_at = latest
+        revocation.revoke(current_jti, expires_at)
+        # access 토큰은 refresh 토큰보다 먼저 만료
+        revocation.revoke(access_jti, expires_at)
+
+
+def reject_rotated(family: str, jti: str, revocation, now: int):
+    """Reject a refresh token rotated out of its family.
+
+    The previous jti within GRACE_PERIOD of its rotation is a
+    concurrent refresh, which loses without consequences. Any
+    other rotated jti is reuse, and revokes the family.
+    """
+    if not (
+        RefreshTokenFamily.objects
+        .filter(
+            family=family,
+            previous_jti=jti,
+            rotated_at__gte=now - GRACE_PERIOD,
+            revoked=False,
+        )
+        .exists()
+    ):
+        revoke_family(family, revocation)
+
+
+def detect_reuse(payload: dict, revocation, now: int):
+    """True if a revoked refresh token was rotated out of its family.
+
+    Rotated tokens are revoked, so presenting one again is
+    rejected as reuse, see reject_rotated.
+    """
+    family = payload.get('fam', payload['jti'])
+    current_jti = (
+        RefreshTokenFamily.objects
+        .filter(family=family)
+        .values_list('current_jti', flat=True)
+        .first()
+    )
+    if current_jti is None or current_jti == payload['jti']:
+        return False
+    reject_rotated(family, payload['jti'], revocation, now)
+    return True
+
+
+def purge_expired_families():
+    return RefreshTokenFamily.objects.filter(
+        expires_at__lte=int(time.time())
+    ).delete()
@@ -1,97 +1,877 @@
-from datetime import datetime
-from uuid import uuid4
-import jwt
+import os
+import re
+import multiprocessing
+import hmac
+import json
+from time import perf_counter
+from datetime import timedelta
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice, repeat
+from uuid import UUID
+from jwt.exceptions import (
+    DecodeError,
+    InvalidAlgorithmError,
+    InvalidSignatureError,
+    InvalidTokenError,
+    ImmatureSignatureError,
+    ExpiredSignatureError,
+)
+from jwt.utils import base64url_decode, base64url_encode
+from asgiref.sync import sync_to_async
 from django.apps import apps
 from django.http import HttpRequest
-from django.conf import settings
 from .apps import DjangoJwtExtConfig
+from .config import compact_token_type, registered_claims
 from .request import REQUESTS
-from .exceptions import InvalidRequest
+from .instrumentation import _callbacks, emit, OUTCOMES
+from .exceptions import (
+    InvalidRequest,
+    JwtVerificationError,
+    InvalidTokenType,
+    ForkNotAvailable,
+    InvalidExpires,
+    InvalidClaims,
+    RevocationNotConfigured,
+    UserLookupNotConfigured,
+    InvalidProfile,
+)
 
+_verified_callbacks = _callbacks['verified']
+_TOKEN_PATTERN = re.compile(r'[A-Za-z0-9_-]+\.[A-Za-z0-9_-]+\.[A-Za-z0-9_-]*')
+_claims_loaders = []
+_user_lookup = None
+_NOT_LOADED = object()
 
-def create_access_token(identity):
+
+def create_access_token(
+    identity, fresh=False, expires_delta=None, additional_claims=None,
+    profile=None,
+):
+    """Issue an access token.
+
+    'fresh' is True or a timedelta the token stays fresh for,
+    'expires_delta' overrides ACCESS_TOKEN_EXPIRES, and
+    'additional_claims' are merged over the registered
+    additional_claims_loader claims. 'profile' names the
+    PROFILES entry whose issuer, audience and expiry apply.
+    """
     config = apps.get_app_config('django_jwt_extended')
-    payload = _create_payload(identity, 'access', config)
-    return jwt.encode(
-        payload=payload,
-        key=settings.SECRET_KEY,
-        algorithm=config.jwt_algorithm
+    payload = _create_payload(
+        identity, 'access', config,
+        expires_delta=expires_delta,
+        fresh=fresh,
+        additional_claims=additional_claims,
+        profile=profile,
     )
+    return _encode_payload(payload, config)
 
 
-def create_refresh_token(identity):
+def create_refresh_token(
+    identity, expires_delta=None, additional_claims=None, profile=None
+):
     config = apps.get_app_config('django_jwt_extended')
-    payload = _create_payload(identity, 'refresh', config)
-    return jwt.encode(
-        payload=payload,
-        key=settings.SECRET_KEY,
-        algorithm=config.jwt_algorithm
+    payload = _create_payload(
+        identity, 'refresh', config,
+        expires_delta=expires_delta,
+        additional_claims=additional_claims,
+        profile=profile,
     )
+    return _encode_payload(payload, config)
+
+
+def additional_claims_loader(callback):
+    """Register callback(identity) -> dict of claims of every access token.
+
+    Claims are embedded once at issuance, so views can read them
+    from get_jwt instead of querying the database. Usable as a
+    decorator.
+    """
+    _claims_loaders.append(callback)
+    return callback
+
+
+class TokenPair:
+    """Access and refresh token issued together.
+
+    Each token carries the jti of its partner in the 'pjti' claim.
+    Unpacks as (access_token, refresh_token).
+    """
+    __slots__ = ('access_token', 'refresh_token', 'access_jti', 'refresh_jti')
+
+    def __init__(self, access_token, refresh_token, access_jti, refresh_jti):
+        self.access_token = access_token
+        self.refresh_token = refresh_token
+        self.access_jti = access_jti
+        self.refresh_jti = refresh_jti
+
+    def __iter__(self):
+        return iter((self.access_token, self.refresh_token))
+
+    def __repr__(self):
+        return f'<TokenPair access_jti={self.access_jti} refresh_jti={self.refresh_jti}>'
+
+
+def create_token_pair(identity, additional_claims=None, profile=None):
+    """Issue an access and a refresh token in one pass"""
+    config = apps.get_app_config('django_jwt_extended')
+    return _issue_pair(
+        *_create_pair_payload(
+            identity, config,
+            additional_claims=additional_claims,
+            profile=profile,
+        ),
+        config,
+    )
+
+
+def refresh_token_pair(request: HttpRequest, profile=None):
+    """Rotate the refresh token of request into a new token pair.
+
+    The old refresh token is revoked, so it needs a
+    REVOCATION_BACKEND. Presenting it again is reuse: its whole
+    family is revoked and JwtVerificationError is raised. A
+    concurrent refresh of the same token is rejected without
+    revoking the family. The refresh token is verified against,
+    and the new pair issued with, 'profile'.
+    """
+    from .rotation import rotate, reject_rotated
+    config = apps.get_app_config('django_jwt_extended')
+    if config.revocation is None:
+        raise RevocationNotConfigured()
+    payload = verify_jwt_in_request(request, refresh=True, profile=profile)
+    family = payload.get('fam', payload['jti'])
+    now = config.clock()
+    access, refresh = _create_pair_payload(
+        payload['sub'], config, now=now, family=family, profile=profile
+    )
+    if not rotate(
+        family, payload['jti'], refresh['jti'], access['jti'],
+        refresh['exp'], now,
+    ):
+        # 같은 토큰을 동시에 rotation한 요청 중 진 쪽, 또는 재사용
+        reject_rotated(family, payload['jti'], config.revocation, now)
+        raise JwtVerificationError(
+            config.refresh_token_reused_msg,
+            config.error_responses['refresh_token_reused_msg'][1],
+        )
+    config.revocation.revoke(payload['jti'], payload['exp'])
+    return _issue_pair(access, refresh, config)
+
+
+def create_tokens_bulk(
+    identities, type='access', processes=None, chunksize=1000, profile=None
+):
+    """Issue one token per identity, streamed in order by a generator.
+
+    Config and key material are resolved once for the whole batch.
+    With 'processes', chunks of identities are signed on a process
+    pool of forked workers, which inherit the app registry.
+    Arguments are validated when called, before any token is issued.
+    """
+    if type not in ('access', 'refresh'):
+        raise InvalidTokenType(type)
+    config = apps.get_app_config('django_jwt_extended')
+    _get_profile(config, profile)
+    if processes:
+        try:
+            context = multiprocessing.get_context('fork')
+        except ValueError:
+            raise ForkNotAvailable()
+        return _create_tokens_pool(
+            identities, type, processes, chunksize, profile, context
+        )
+    return _create_tokens(identities, type, profile, config)
 
 
 def get_jwt_identity(request: HttpRequest):
-    if not any([isinstance(request, obj) for obj in REQUESTS]):
+    if not isinstance(request, REQUESTS):
         raise InvalidRequest(str(type(request)))
-    if 'jwt_payload' in request.META:
-        return request.META['jwt_payload'].get('sub')
+    payload = get_jwt(request)
+    if payload is not None:
+        return payload.get('sub')
     else:
         return None
 
 
 def get_jwt(request: HttpRequest):
-    if not any([isinstance(request, obj) for obj in REQUESTS]):
+    if not isinstance(request, REQUESTS):
         raise InvalidRequest(str(type(request)))
-    return request.META.get('jwt_payload')
+    state = getattr(request, 'jwt', None)
+    return state.payload if state is not None else None
+
+
+def user_lookup_loader(callback):
+    """Register callback(identity) -> user of get_current_user.
+
+    Usable as a decorator. Returning None means no such user.
+    """
+    global _user_lookup
+    _user_lookup = callback
+    return callback
+
+
+def get_current_user(request: HttpRequest):
+    """User of the accepted token, looked up at most once per request.
+
+    With USER_CACHE_SIZE, found users are also cached across
+    requests by identity for USER_CACHE_TTL seconds.
+    """
+    payload = get_jwt(request)
+    if payload is None:
+        return None
+    state = request.jwt
+    if state.user is not _NOT_LOADED:
+        return state.user
+    if _user_lookup is None:
+        raise UserLookupNotConfigured()
+    identity = payload.get('sub')
+    cache = apps.get_app_config('django_jwt_extended').user_cache
+    user = cache.get(identity) if cache is not None else None
+    if user is None:
+        user = _user_lookup(identity)
+        if cache is not None and user is not None:
+            cache.set(identity, user)
+    state.user = user
+    return user
+
+
+def invalidate_user(identity):
+    """Drop a user from the cross-request cache, e.g. after it changed"""
+    cache = apps.get_app_config('django_jwt_extended').user_cache
+    if cache is not None:
+        cache.invalidate(identity)
+
+
+def verify_jwt_in_request(
+    request: HttpRequest, optional=False, refresh=False, profile=None
+):
+    """Verify the JWT of request outside of a decorated view.
+
+    Returns the payload (None for a missing optional token),
+    or raises JwtVerificationError with the configured error message.
+    """
+    if not isinstance(request, REQUESTS):
+        raise InvalidRequest(str(type(request)))
+    state = _get_jwt_state(request)
+    return _accept(
+        state, *state.verify(request, refresh, profile), optional, profile
+    )
+
+
+async def averify_jwt_in_request(
+    request: HttpRequest, optional=False, refresh=False, profile=None
+):
+    """Async version of verify_jwt_in_request.
+
+    Verification is CPU only, so it runs on the event loop.
+    Only a revocation backend lookup runs in a thread.
+    """
+    if not isinstance(request, REQUESTS):
+        raise InvalidRequest(str(type(request)))
+    state = _get_jwt_state(request)
+    return _accept(
+        state, *(await state.averify(request, refresh, profile)),
+        optional, profile,
+    )
+
+
+def revoke_token(payload: dict):
+    """Revoke a token by its jti until it expires"""
+    config = apps.get_app_config('django_jwt_extended')
+    if config.revocation is None:
+        raise RevocationNotConfigured()
+    config.revocation.revoke(payload['jti'], payload['exp'])
+
+
+class JwtState:
+    """Verification result of a request, stored as "request.jwt".
+
+    The token is found and decoded lazily, at most once
+    per token type, however many times it is asked for.
+    'payload' and 'profile' are set once a view accepted the
+    token, and 'user' once get_current_user looked it up.
+    """
+    __slots__ = ('payload', 'profile', 'user', '_results')
+
+    def __init__(self):
+        self.payload = None
+        self.profile = None
+        self.user = _NOT_LOADED
+        self._results = {}
+
+    def verify(self, request, refresh=False, profile=None):
+        key = _verifier_key(refresh, profile)
+        result = self._results.get(key)
+        if result is None:
+            config = apps.get_app_config('django_jwt_extended')
+            result = _verify_jwt_token(request, refresh, config, profile)
+            jti = _revocable_jti(result[0], config)
+            if jti is not None and config.revocation.is_revoked(jti):
+                result = None, _revoked_error(result[0], refresh, config)
+            result = self._results[key] = _verified(result)
+        return result
+
+    async def averify(self, request, refresh=False, profile=None):
+        key = _verifier_key(refresh, profile)
+        result = self._results.get(key)
+        if result is None:
+            config = apps.get_app_config('django_jwt_extended')
+            result = _verify_jwt_token(request, refresh, config, profile)
+            jti = _revocable_jti(result[0], config)
+            if jti is not None and await config.revocation.ais_revoked(jti):
+                result = None, await sync_to_async(_revoked_error)(
+                    result[0], refresh, config
+                )
+            result = self._results[key] = _verified(result)
+        return result
 
 
 """Inner Func"""
-def _create_payload(identity, type: str, config: DjangoJwtExtConfig):
-    if type == 'access':
-        expires = config.access_token_expires
+def _get_jwt_state(request):
+    state = getattr(request, 'jwt', None)
+    if state is None:
+        state = request.jwt = JwtState()
+    return state
+
+
+def _revocable_jti(payload, config: DjangoJwtExtConfig):
+    if config.revocation is None or payload is None:
+        return None
+    return payload.get('jti')
+
+
+def _revoked_error(payload: dict, refresh: bool, config: DjangoJwtExtConfig):
+    """Error of a revoked token, a rotated refresh token is a reuse"""
+    if refresh:
+        from .rotation import detect_reuse
+        if detect_reuse(payload, config.revocation, config.clock()):
+            return 'refresh_token_reused_msg'
+    return 'revoked_token_msg'
+
+
+def _verified(result: tuple):
+    if _verified_callbacks:
+        emit('verified', OUTCOMES[result[1]])
+    return result
+
+
+def _accept(state: JwtState, payload, error, optional: bool, profile=None):
+    if error is None:
+        state.payload = payload
+        state.profile = profile
+        return payload
+    if optional and error == 'jwt_not_found_msg':
+        return None
+    config = apps.get_app_config('django_jwt_extended')
+    raise JwtVerificationError(
+        getattr(config, error), config.error_responses[error][1]
+    )
+
+
+def _create_payload(
+    identity, type: str, config: DjangoJwtExtConfig, now=None,
+    expires_delta=None, fresh=False, additional_claims=None, profile=None,
+    carried_claims=None,
+):
+    profile = _get_profile(config, profile)
+    if expires_delta is not None:
+        expires = _expires_seconds(expires_delta)
+    elif type == 'access':
+        expires = profile.access_token_expires
     else:
-        expires = config.refresh_token_expires
-    now = datetime.utcnow()
-    return {
+        expires = profile.refresh_token_expires
+    if now is None:
+        now = config.clock()
+    payload = {
         'iat': now,
-        'jti': str(uuid4()),
+        'jti': _encode_jti(os.urandom(16), config),
         'type': type,
         'sub': identity,
         'nbf': now,
         'exp': now + expires,
     }
+    _add_profile_claims(payload, profile)
+    if fresh:
+        payload['fresh'] = (
+            now + int(fresh.total_seconds())
+            if isinstance(fresh, timedelta)
+            else True
+        )
+    if config.csrf_protect:
+        payload['csrf'] = _new_csrf_token()
+    if (
+        additional_claims
+        or carried_claims
+        or (type == 'access' and _claims_loaders)
+    ):
+        _add_claims(
+            payload, identity, type, additional_claims, carried_claims
+        )
+    if config.compact_tokens or config.omit_claims:
+        _compact_payload(payload, config)
+    return payload
+
+
+def _get_profile(config: DjangoJwtExtConfig, name):
+    try:
+        return config.profiles[name]
+    except KeyError:
+        raise InvalidProfile('profile', name)
+
+
+def _add_profile_claims(payload: dict, profile):
+    if profile.issuer is not None:
+        payload['iss'] = profile.issuer
+    if profile.audience_claim is not None:
+        payload['aud'] = profile.audience_claim
+
+
+def _expires_seconds(expires_delta):
+    if isinstance(expires_delta, timedelta):
+        expires_delta = int(expires_delta.total_seconds())
+    if not (
+        isinstance(expires_delta, int)
+        and not isinstance(expires_delta, bool)
+        and expires_delta > 0
+    ):
+        raise InvalidExpires('expires_delta')
+    return expires_delta
 
 
-def _find_jwt_token(request, refresh: bool, config: DjangoJwtExtConfig):
-    for location in config.token_location:
-        if (
-            location == 'headers'
-            and config.token_header_name in request.headers
+def _add_claims(
+    payload: dict, identity, type: str, additional_claims=None,
+    carried_claims=None,
+):
+    """Merge carried, loader and additional claims, in that order.
+
+    'carried_claims' of a replaced token are overridden by the
+    loaders, so loader claims are always current. Registered
+    claims can't be overridden.
+    """
+    claims = dict(carried_claims) if carried_claims else {}
+    if type == 'access':
+        for loader in _claims_loaders:
+            claims.update(loader(identity))
+    if additional_claims:
+        claims.update(additional_claims)
+    if not registered_claims.isdisjoint(claims):
+        raise InvalidClaims(sorted(registered_claims.intersection(claims)))
+    payload.update(claims)
+
+
+def _new_csrf_token():
+    return base64url_encode(os.urandom(16)).decode()
+
+
+def _encode_jti(random: bytes, config: DjangoJwtExtConfig):
+    if config.compact_tokens:
+        # 36자 UUID 대신 22자 base64url
+        return base64url_encode(random).decode()
+    return str(UUID(bytes=random, version=4))
+
+
+def _compact_payload(payload: dict, config: DjangoJwtExtConfig, keep_jti=False):
+    """Apply COMPACT_TOKENS and OMIT_CLAIMS to a payload, in place"""
+    if config.compact_tokens:
+        payload['type'] = compact_token_type[payload['type']]
+        if payload.get('nbf') == payload['iat']:
+            del payload['nbf']
+    for claim in config.omit_claims:
+        if not (keep_jti and claim == 'jti'):
+            payload.pop(claim, None)
+
+
+def _encode_payload(payload: dict, config: DjangoJwtExtConfig):
+    return config.active_key.encode(payload)
+
+
+def _create_tokens_pool(identities, type, processes, chunksize, profile, context):
+    with ProcessPoolExecutor(processes, mp_context=context) as executor:
+        for tokens in executor.map(
+            _create_tokens_chunk,
+            _chunks(identities, chunksize),
+            repeat(type),
+            repeat(profile),
         ):
-            return request.headers[config.token_header_name], location
+            yield from tokens
 
-        elif location == 'cookies':
-            if not refresh and config.access_token_cookie_name in request.COOKIES:
-                return request.COOKIES[config.access_token_cookie_name], location
-            elif refresh and config.refresh_token_cookie_name in request.COOKIES:
-                return request.COOKIES[config.refresh_token_cookie_name], location
 
-    return None, None
+def _create_tokens(identities, type, profile, config: DjangoJwtExtConfig):
+    key = config.active_key
+    now = config.clock()
+    for identity in identities:
+        yield key.encode(
+            _create_payload(identity, type, config, now, profile=profile)
+        )
 
 
-def _parse_jwt_token(jwt_token: str, location: str):
-    if location == 'headers':
-        if jwt_token.startswith('Bearer '):
-            return jwt_token[7:]
-    elif location == 'cookies':
-        return jwt_token
-    else:
+def _create_tokens_chunk(identities: list, type: str, profile=None):
+    return list(create_tokens_bulk(identities, type, profile=profile))
+
+
+def _chunks(iterable, size: int):
+    iterator = iter(iterable)
+    chunk = list(islice(iterator, size))
+    while chunk:
+        yield chunk
+        chunk = list(islice(iterator, size))
+
+
+def _issue_pair(access: dict, refresh: dict, config: DjangoJwtExtConfig):
+    return TokenPair(
+        config.active_key.encode(access),
+        config.active_key.encode(refresh),
+        access['jti'],
+        refresh['jti'],
+    )
+
+
+def _create_pair_payload(
+    identity, config: DjangoJwtExtConfig, now=None, family=None,
+    additional_claims=None, profile=None,
+):
+    profile = _get_profile(config, profile)
+    if now is None:
+        now = config.clock()
+    # 한 번의 난수로 두 토큰의 jti를 생성
+    random = os.urandom(32)
+    access_jti = _encode_jti(random[:16], config)
+    refresh_jti = _encode_jti(random[16:], config)
+    access = {
+        'iat': now,
+        'jti': access_jti,
+        'type': 'access',
+        'sub': identity,
+        'nbf': now,
+        'exp': now + profile.access_token_expires,
+        'pjti': refresh_jti,
+    }
+    _add_profile_claims(access, profile)
+    refresh = dict(
+        access,
+        jti=refresh_jti,
+        type='refresh',
+        exp=now + profile.refresh_token_expires,
+        pjti=access_jti,
+    )
+    if family is not None:
+        refresh['fam'] = family
+    if config.csrf_protect:
+        access['csrf'] = _new_csrf_token()
+        refresh['csrf'] = _new_csrf_token()
+    if additional_claims or _claims_loaders:
+        _add_claims(access, identity, 'access', additional_claims)
+    if config.compact_tokens or config.omit_claims:
+        # 두 토큰은 jti로 서로를 가리키므로 jti는 유지
+        _compact_payload(access, config, keep_jti=True)
+        _compact_payload(refresh, config, keep_jti=True)
+    return access, refresh
+
+
+def _compile_extractor(refresh: bool, config: DjangoJwtExtConfig):
+    """Build the token extractor of a token type, once.
+
+    Locations, header and cookie names are resolved here, so
+    the extractor is a fixed sequence of dict lookups returning
+    (jwt_token, None, csrf), (None, <error>, None) or
+    (None, None, None) if absent. 'csrf' is the CSRF header value
+    the 'csrf' claim must match, or None if there is nothing to check.
+    """
+    header_name = config.token_header_name
+    header_key = 'HTTP_' + header_name.upper().replace('-', '_')
+    cookie_name = (
+        config.refresh_token_cookie_name
+        if refresh
+        else config.access_token_cookie_name
+    )
+
+    found = _callbacks['token_found']
+    csrf_protect = config.csrf_protect
+    csrf_methods = config.csrf_methods
+    csrf_header_name = config.csrf_header_name
+    csrf_header_key = 'HTTP_' + csrf_header_name.upper().replace('-', '_')
+
+    def from_headers(request):
+        value = request.META.get(header_key)
+        if value is None:
+            # META 키가 대문자가 아닌 경우 (e.g. RequestFactory) 대소문자 무시
+            value = request.headers.get(header_name)
+            if value is None:
+                return None, None, None
+        if found:
+            emit('token_found', 'headers')
+        # header 토큰에 한하여, Bearer 포맷이 아닐 경우
+        if value[:7] != 'Bearer ':
+            return None, 'bearer_error_msg', None
+        return value[7:], None, None
+
+    def from_cookies(request):
+        jwt_token = request.COOKIES.get(cookie_name)
+        if jwt_token is None:
+            return None, None, None
+        if found:
+            emit('token_found', 'cookies')
+        if csrf_protect and request.method in csrf_methods:
+            # double-submit: 쿠키 토큰에는 CSRF 헤더가 필요
+            csrf = (
+                request.META.get(csrf_header_key)
+                or request.headers.get(csrf_header_name)
+            )
+            if not csrf:
+                return None, 'csrf_error_msg', None
+            return jwt_token, None, csrf
+        return jwt_token, None, None
+
+    def from_nowhere(request):
+        return None, None, None
+
+    # 중복된 위치는 한 번만 확인
+    extractors = [
+        from_headers if location == 'headers' else from_cookies
+        for location in dict.fromkeys(config.token_location)
+    ]
+    if not extractors:
+        return from_nowhere
+    if len(extractors) == 1:
+        return extractors[0]
+    first, second = extractors
+
+    def from_both(request):
+        result = first(request)
+        if result[0] is None and result[1] is None:
+            return second(request)
+        return result
+    return from_both
+
+
+def _verifier_key(refresh: bool, profile=None):
+    """Key of config.verifiers, the default profile is keyed by 'refresh' alone"""
+    return refresh if profile is None else (refresh, profile)
+
+
+def _compile_verifier(refresh: bool, config: DjangoJwtExtConfig, profile=None):
+    """Build the verification pipeline of a token type and profile, once"""
+    extract = _compile_extractor(refresh, config)
+    token_type = 'refresh' if refresh else 'access'
+    decoded = _callbacks['decoded']
+    max_length = config.max_token_length
+    profile = config.profiles[profile]
+    issuer = profile.issuer
+    audience = profile.audience
+
+    def verify(request):
+        jwt_token, error, csrf = extract(request)
+        if jwt_token is None:
+            # 토큰을 찾을 수 없을 경우
+            return None, error or 'jwt_not_found_msg'
+        # 디코딩 전에 길이와 구조가 잘못된 토큰을 거부
+        if not _is_well_formed(jwt_token, max_length):
+            return None, 'malformed_token_msg'
+
+        start = perf_counter() if decoded else 0
+        try:
+            payload = _decode_jwt_token(jwt_token, config)
+        except InvalidSignatureError:
+            error = 'decode_error_msg'
+        except ImmatureSignatureError:
+            error = 'invalid_nbf_msg'
+        except ExpiredSignatureError:
+            error = 'expired_token_msg'
+        except InvalidTokenError:
+            error = 'malformed_token_msg'
+        if decoded:
+            emit('decoded', perf_counter() - start)
+        if error is not None:
+            return None, error
+
+        # 토큰의 유효기간, 액세스/리프레시 검증
+        valid = _validate_payload(payload, token_type)
+        if valid == 'type not found':
+            return None, 'token_type_not_found_msg'
+        if valid == 'invalid type':
+            return None, 'invalid_token_type_msg'
+        if issuer is not None and payload.get('iss') != issuer:
+            return None, 'invalid_issuer_msg'
+        if (audience is not None or 'aud' in payload) and not _has_audience(
+            payload.get('aud'), audience
+        ):
+            return None, 'invalid_audience_msg'
+        if csrf is not None:
+            claim = payload.get('csrf')
+            if not (
+                isinstance(claim, str)
+                and hmac.compare_digest(claim.encode(), csrf.encode())
+            ):
+                return None, 'csrf_error_msg'
+        return payload, None
+    return verify
+
+
+def _compile_authorizer(scopes, roles, fresh: bool):
+    """Build the claim checks of jwt_required, once.
+
+    Every scope and at least one of the roles are required.
+    Returns None when there is nothing to check.
+    """
+    scopes = frozenset(scopes) if scopes else None
+    roles = frozenset(roles) if roles else None
+    if scopes is None and roles is None and not fresh:
+        return None
+
+    def authorize(payload):
+        if fresh:
+            claim = payload.get('fresh')
+            if not (
+                claim is True
+                or (
+                    type(claim) in (int, float)
+                    and claim > apps.get_app_config('django_jwt_extended').clock()
+                )
+            ):
+                return 'fresh_token_required_msg'
+        if scopes is not None:
+            # OAuth 2.0 'scope': 공백으로 구분된 문자열 또는 리스트
+            claim = payload.get('scope')
+            if isinstance(claim, str):
+                claim = claim.split()
+            if not (isinstance(claim, list) and scopes.issubset(claim)):
+                return 'insufficient_scope_msg'
+        if roles is not None:
+            claim = payload.get('roles')
+            if isinstance(claim, str):
+                claim = (claim,)
+            if not isinstance(claim, (list, tuple)) or roles.isdisjoint(claim):
+                return 'missing_role_msg'
+        return None
+    return authorize
+
+
+def _has_audience(claim, audience):
+    """'aud' claim ("str" or "list") names one of the audience of a profile.
+
+    A token with an audience is rejected by a profile without one.
+    """
+    if audience is None:
+        return False
+    if isinstance(claim, str):
+        return claim in audience
+    return isinstance(claim, list) and any(
+        isinstance(item, str) and item in audience for item in claim
+    )
+
+
+def _is_well_formed(jwt_token: str, max_length: int):
+    """Structural check before any base64 or JSON work"""
+    return (
+        len(jwt_token) <= max_length
+        and _TOKEN_PATTERN.fullmatch(jwt_token) is not None
+    )
+
+
+def _parse_header_segment(segment: str):
+    """(kid, alg) of a JOSE header segment, or None if malformed"""
+    try:
+        header = json.loads(base64url_decode(segment))
+    except (ValueError, TypeError):
+        return None
+    if not isinstance(header, dict) or not isinstance(header.get('alg'), str):
         return None
+    kid = header.get('kid')
+    if kid is not None and not isinstance(kid, str):
+        return None
+    return kid, header['alg']
+
+
+def _resolve_key(jwt_token: str, config: DjangoJwtExtConfig):
+    """Verification key of the token.
+
+    Header segments of the keyring map straight to their key.
+    Any other header (e.g. of another issuer) is parsed per
+    request and never stored, so junk headers can't fill a cache.
+    """
+    segment = jwt_token[:jwt_token.index('.')]
+    key = config.key_segments.get(segment)
+    if key is not None:
+        return key
+    header = _parse_header_segment(segment)
+    if header is None:
+        raise DecodeError('Invalid header')
+    kid, algorithm = header
+    if len(config.keys) == 1:
+        key = config.active_key
+    else:
+        key = config.keys.get(kid)
+        if key is None:
+            raise InvalidSignatureError(f'Unknown kid: {kid}')
+    if key.algorithm != algorithm:
+        raise InvalidAlgorithmError(f'Unexpected alg: {algorithm}')
+    return key
+
+
+def _decode_jwt_token(jwt_token: str, config: DjangoJwtExtConfig):
+    cache = config.token_cache
+    if cache is not None:
+        payload = cache.get(jwt_token)
+        if payload is not None:
+            # 캐시는 wall clock으로 만료되므로 CLOCK 기준으로 다시 검증
+            _validate_claims(payload, config.clock(), config.leeway)
+            return payload
+    key = _resolve_key(jwt_token, config)
+    # 헤더는 이미 해석되었으므로 서명과 페이로드만 처리
+    signing_input, _, signature = jwt_token.rpartition('.')
+    try:
+        signature = base64url_decode(signature)
+        payload = signing_input[signing_input.index('.') + 1:]
+        signing_input = signing_input.encode()
+    except (ValueError, TypeError):
+        raise DecodeError('Invalid crypto padding')
+    if not key.verify(signing_input, signature):
+        raise InvalidSignatureError('Signature verification failed')
+    try:
+        payload = json.loads(base64url_decode(payload))
+    except (ValueError, TypeError):
+        raise DecodeError('Invalid payload')
+    if not isinstance(payload, dict):
+        raise DecodeError('Invalid payload')
+    _validate_claims(payload, config.clock(), config.leeway)
+    if cache is not None:
+        cache.set(jwt_token, payload)
+    return payload
+
+
+def _validate_claims(payload: dict, now: float, leeway: int = 0):
+    """Registered claim checks of jwt.decode, in the same order.
+
+    'leeway' seconds of clock skew between nodes are tolerated.
+    """
+    for claim in ('iat', 'nbf', 'exp'):
+        if claim in payload and not isinstance(payload[claim], (int, float)):
+            raise DecodeError(f'The {claim} claim must be a number')
+    if 'iat' in payload and payload['iat'] > now + leeway:
+        raise ImmatureSignatureError('The token is not yet valid (iat)')
+    if 'nbf' in payload and payload['nbf'] > now + leeway:
+        raise ImmatureSignatureError('The token is not yet valid (nbf)')
+    if 'exp' in payload and payload['exp'] <= now - leeway:
+        raise ExpiredSignatureError('Signature has expired')
+
+
+def _verify_jwt_token(
+    request, refresh: bool, config: DjangoJwtExtConfig, profile=None
+):
+    """Returns (payload, None) or (None, <error message attribute of config>)"""
+    try:
+        verify = config.verifiers[_verifier_key(refresh, profile)]
+    except KeyError:
+        raise InvalidProfile('profile', profile)
+    return verify(request)
 
 
 def _validate_payload(payload: dict, type: str):
     if 'type' not in payload:
         return 'type not found'
     elif payload['type'] != type:
-        return 'invalid type'
-    else:
-        return "valid"
\ No newline at end of file
+        if payload['type'] != compact_token_type[type]:
+            return 'invalid type'
+        # 압축 프로필의 type 코드를 원래 이름으로 복원
+        payload['type'] = type
+    return "valid"
\ No newline at end of file
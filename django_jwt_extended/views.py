@@ -0,0 +1,30 @@
+from django.apps import apps
+from django.http import Http404, HttpResponse, HttpResponseNotModified
+from django.views.decorators.http import require_GET
+
+
+@require_GET
+def jwks(request):
+    """Serve the public keys of the keyring (JWKS)"""
+    config = apps.get_app_config('django_jwt_extended')
+    if request.headers.get('If-None-Match') == config.jwks_etag:
+        response = HttpResponseNotModified()
+    else:
+        response = HttpResponse(
+            config.jwks_body, content_type='application/json'
+        )
+    response['ETag'] = config.jwks_etag
+    response['Cache-Control'] = config.jwks_cache_control
+    return response
+
+
+@require_GET
+def metrics(request):
+    """Serve the in-process metrics (Prometheus text format)"""
+    config = apps.get_app_config('django_jwt_extended')
+    if config.metrics is None:
+        raise Http404('METRICS is disabled.')
+    return HttpResponse(
+        config.metrics.render(),
+        content_type='text/plain; version=0.0.4; charset=utf-8',
+    )
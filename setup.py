@@ -5,7 +5,7 @@ django-jwt-extended
 An open source Django extension that provides Simple JWT Authentication
 """
 
-from setuptools import setup
+from setuptools import setup, find_packages
 from django_jwt_extended import __VERSION__
 
 
@@ -24,8 +24,14 @@ setup(
     author_email='shin10256@gmail.com',
     license='MIT',
     keywords='django jwt extended',
-    packages=['django_jwt_extended'],
+    packages=find_packages(
+        include=['django_jwt_extended', 'django_jwt_extended.*']
+    ),
     install_requires=['django'],
+    extras_require={
+        'crypto': ['PyJWT[crypto]'],
+        'drf': ['djangorestframework'],
+    },
     platforms='any',
     classifiers=[
         'Environment :: Web Environment',
@@ -55,7 +55,14 @@ def setup_django():
             'REFRESH_TOKEN_EXPIRES': timedelta(days=30),
             'JWT_NOT_FOUND_MSG': {'msg': "can't find JWT token."},
             'ACCESS_TOKEN_COOKIE_NAME': 'access_token',
-            'REFRESH_TOKEN_COOKIE_NAME': 'refresh_token'
+            'REFRESH_TOKEN_COOKIE_NAME': 'refresh_token',
+            'PROFILES': {
+                'mobile': {
+                    'ISSUER': 'https://auth.example.com',
+                    'AUDIENCE': ['mobile', 'tablet'],
+                    'ACCESS_TOKEN_EXPIRES': timedelta(hours=1),
+                },
+            },
         },
         TIME_ZONE='Asia/Seoul',
         USE_TZ=False,
@@ -2,9 +2,15 @@ from django.http import JsonResponse
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework.decorators import api_view
+from rest_framework.permissions import IsAuthenticated
 from django_jwt_extended import jwt_required
 from django_jwt_extended import create_access_token
 from django_jwt_extended import create_refresh_token
+from django_jwt_extended import create_token_pair
+from django_jwt_extended import refresh_token_pair
+from django_jwt_extended.exceptions import JwtVerificationError
+from django_jwt_extended.authentication import JWTAuthentication
+from django_jwt_extended.permissions import HasClaims
 from django_jwt_extended import get_jwt_identity
 from django_jwt_extended import get_jwt
 
@@ -16,6 +22,14 @@ def login(request):
         'refresh_token': create_refresh_token('iml'),
     })
 
+# Login and issue a token pair in one pass
+def login_pair(request):
+    access_token, refresh_token = create_token_pair("iml")
+    return JsonResponse({
+        "access_token": access_token,
+        'refresh_token': refresh_token,
+    })
+
 # Refresh tokens
 @jwt_required(refresh=True)
 def refresh(request):
@@ -26,6 +40,19 @@ def refresh(request):
     })
 
 
+# Rotate refresh token
+@jwt_required(refresh=True)
+def rotate(request):
+    try:
+        access_token, refresh_token = refresh_token_pair(request)
+    except JwtVerificationError as e:
+        return JsonResponse(e.msg, status=e.status)
+    return JsonResponse({
+        "access_token": access_token,
+        'refresh_token': refresh_token,
+    })
+
+
 # Authentication access token
 @jwt_required()
 def user(request):
@@ -36,6 +63,13 @@ def user(request):
         'raw_jwt': payload,
     })
 
+# Authentication access token (async view)
+@jwt_required()
+async def async_user(request):
+    identity = get_jwt_identity(request)
+    return JsonResponse({'id': identity})
+
+
 # Authentication access token with Decorator
 def login_required(func):
     @jwt_required()
@@ -118,4 +152,32 @@ def rest_user(request, hello: str):
         'id': identity,
         'raw_jwt': payload,
         'hello': hello,
-    })
\ No newline at end of file
+    })
+
+# Claims based authorization
+@jwt_required(scopes=['read', 'write'], roles=['admin', 'staff'])
+def scoped_user(request):
+    return JsonResponse({'id': get_jwt_identity(request)})
+
+
+@jwt_required(fresh=True)
+def fresh_user(request):
+    return JsonResponse({'id': get_jwt_identity(request)})
+
+
+@jwt_required(profile='mobile')
+def mobile_user(request):
+    return JsonResponse({'id': get_jwt_identity(request)})
+
+
+# Rest framework authentication class
+class RestAuthenticatedView(APIView):
+    authentication_classes = [JWTAuthentication]
+    permission_classes = [IsAuthenticated, HasClaims]
+    jwt_roles = ['admin']
+
+    def get(self, request):
+        return Response({
+            'id': request.user.pk,
+            'raw_jwt': request.auth,
+        })
@@ -1,11 +1,21 @@
 from http.cookiejar import Cookie
-import unittest, json, jwt
+import unittest, json, jwt, asyncio
+from jwt.utils import base64url_encode
 from django.conf import settings
 from django.test import RequestFactory
 from django.apps import apps
+from django_jwt_extended import (
+    create_access_token,
+    verify_jwt_in_request,
+    averify_jwt_in_request,
+)
+from django_jwt_extended.clock import FrozenClock
+from django_jwt_extended.exceptions import JwtVerificationError
+from django_jwt_extended.keys import JwtKey, index_segments
+from django_jwt_extended.tokens import _compile_extractor
 from tests.sample.views import (
     login, decorator_user, refresh, 
-    user, user_optional,
+    user, user_optional, async_user,
     RestAPIView, rest_user
 )
 
@@ -47,6 +57,37 @@ class AuthTestCase(unittest.TestCase):
         response = decorator_user(request)
         self.assertEqual(response.status_code, 200)
 
+    def test_auth_async(self):
+        """Run Authentication with async view"""
+        request = self.factory.get(
+            '/user',
+            HTTP_Authorization=(
+                "Bearer " + self.access_token
+            )
+        )
+        response = asyncio.run(async_user(request))
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(json.loads(response.content)['id'], 'iml')
+
+        response = asyncio.run(async_user(self.factory.get('/user')))
+        self.assertEqual(response.status_code, 401)
+
+    def test_verify_jwt_in_request(self):
+        """Run verify API without decorator"""
+        request = self.factory.get(
+            '/user',
+            HTTP_Authorization=(
+                "Bearer " + self.access_token
+            )
+        )
+        payload = asyncio.run(averify_jwt_in_request(request))
+        self.assertEqual(payload['sub'], 'iml')
+        self.assertIsNone(
+            verify_jwt_in_request(self.factory.get('/user'), optional=True)
+        )
+        with self.assertRaises(JwtVerificationError):
+            verify_jwt_in_request(self.factory.get('/user'))
+
     def test_refresh(self):
         """Run Token Refresh & reauth"""
         request = self.factory.get(
@@ -132,6 +173,83 @@ class AuthTestCase(unittest.TestCase):
             json.dumps({'msg': "can't find JWT token."})
         )
 
+    def test_error_response_headers(self):
+        """Test WWW-Authenticate and custom status of error responses"""
+        response = user(self.factory.get('/user'))
+        self.assertEqual(response['WWW-Authenticate'], 'Bearer')
+        self.assertEqual(response['Content-Type'], 'application/json')
+
+        config = apps.get_app_config('django_jwt_extended')
+        origin = config.error_responses
+        config.error_responses = dict(origin)
+        config.error_responses.update(config.serialize_errors(
+            {'INVALID_TOKEN_TYPE_MSG': config.invalid_token_type_msg},
+            {'INVALID_TOKEN_TYPE_MSG': 403},
+        ))
+        try:
+            request = self.factory.get(
+                '/user',
+                HTTP_Authorization=(
+                    "Bearer " + self.refresh_token
+                )
+            )
+            response = user(request)
+        finally:
+            config.error_responses = origin
+        self.assertEqual(response.status_code, 403)
+        self.assertFalse(response.has_header('WWW-Authenticate'))
+
+    def test_malformed_token_auth(self):
+        """Test Malformed Token Auth"""
+        none_token = jwt.encode({'sub': 'iml', 'type': 'access'}, None, 'none')
+        hs512_token = jwt.encode(
+            {'sub': 'iml', 'type': 'access'}, settings.SECRET_KEY, 'HS512'
+        )
+        # PyJWT는 문자열이 아닌 kid를 인코딩하지 않으므로 헤더만 교체
+        list_kid_token = '.'.join((
+            base64url_encode(b'{"alg":"HS256","kid":[1]}').decode(),
+            *self.access_token.split('.')[1:],
+        ))
+        tokens = (
+            'garbage',
+            'a.b.c',
+            'a.b.c.d',
+            self.access_token + '$',
+            'a' * 10000 + '.b.c',
+            none_token,
+            hs512_token,
+            list_kid_token,
+        )
+        self._assert_malformed(tokens)
+
+        # kid로 키를 찾는 다중 키 키링에서도 헤더가 잘못되면 401
+        config = apps.get_app_config('django_jwt_extended')
+        origin = config.keys, config.active_key, config.key_segments
+        keys = {
+            kid: JwtKey(kid, 'HS256', settings.SECRET_KEY, settings.SECRET_KEY)
+            for kid in ('a', 'b')
+        }
+        config.keys, config.active_key = keys, keys['a']
+        config.key_segments = index_segments(keys.values())
+        try:
+            self._assert_malformed(('garbage', 'a.b.c', list_kid_token))
+        finally:
+            config.keys, config.active_key, config.key_segments = origin
+
+    def _assert_malformed(self, tokens):
+        for token in tokens:
+            request = self.factory.get(
+                '/user',
+                HTTP_Authorization=(
+                    "Bearer " + token
+                )
+            )
+            response = user(request)
+            self.assertEqual(response.status_code, 401)
+            self.assertEqual(
+                json.loads(response.content), {'msg': 'Malformed JWT token'}
+            )
+
     def test_token_header_not_bearer(self):
         """Test Token Header Not Bearer"""
         request = self.factory.get(
@@ -159,6 +277,69 @@ class AuthTestCase(unittest.TestCase):
         response = user(request)
         self.assertEqual(response.status_code, 401)
 
+    def test_claims_validation(self):
+        """Test claims checked without jwt.decode"""
+        config = apps.get_app_config('django_jwt_extended')
+        header, _, signature = self.access_token.split('.')
+        tampered = jwt.utils.base64url_encode(
+            json.dumps({'sub': 'admin', 'type': 'access'}).encode()
+        ).decode()
+        for payload, expected in (
+            ({'sub': 'iml', 'type': 'access', 'nbf': 2 ** 40},
+                config.invalid_nbf_msg),
+            ({'sub': 'iml', 'type': 'access', 'iat': 2 ** 40},
+                config.invalid_nbf_msg),
+            ({'sub': 'iml', 'type': 'access', 'exp': 'never'},
+                config.malformed_token_msg),
+            ({'sub': 'iml', 'type': 'access', 'aud': 'other'},
+                config.invalid_audience_msg),
+            ({'sub': 'iml'}, config.token_type_not_found_msg),
+        ):
+            token = jwt.encode(payload, settings.SECRET_KEY, 'HS256')
+            response = user(self.factory.get(
+                '/user', HTTP_Authorization="Bearer " + token
+            ))
+            self.assertEqual(response.status_code, 401)
+            self.assertEqual(json.loads(response.content), expected)
+
+        response = user(self.factory.get(
+            '/user',
+            HTTP_Authorization="Bearer " + '.'.join(
+                (header, tampered, signature)
+            )
+        ))
+        self.assertEqual(json.loads(response.content), config.decode_error_msg)
+
+    def test_clock_and_leeway(self):
+        """Test injected clock and clock skew leeway"""
+        config = apps.get_app_config('django_jwt_extended')
+        origin = config.clock, config.leeway
+        clock = config.clock = FrozenClock(1700000000)
+        try:
+            token = create_access_token('iml', expires_delta=300)
+
+            def get():
+                return user(self.factory.get(
+                    '/user', HTTP_Authorization="Bearer " + token
+                ))
+
+            # 시계가 느린 노드
+            clock.tick(-30)
+            self.assertEqual(
+                json.loads(get().content), config.invalid_nbf_msg
+            )
+            config.leeway = 60
+            self.assertEqual(get().status_code, 200)
+
+            clock.tick(30 + 300 + 10)
+            self.assertEqual(get().status_code, 200)
+            config.leeway = 0
+            self.assertEqual(
+                json.loads(get().content), config.expired_token_msg
+            )
+        finally:
+            config.clock, config.leeway = origin
+
     #cookie test
     def test_auth_basic_cookie(self):
         """Run Authentication basic"""
@@ -256,6 +437,35 @@ class AuthTestCase(unittest.TestCase):
         response = user(request)
         self.assertEqual(response.status_code, 401)
 
+    def test_token_locations(self):
+        """Empty and duplicated LOCATION entries are compiled"""
+        config = apps.get_app_config('django_jwt_extended')
+        origin = config.token_location
+        request = self.factory.get(
+            '/user', HTTP_Authorization="Bearer " + self.access_token
+        )
+        request.COOKIES = {'access_token': self.access_token}
+        try:
+            config.token_location = []
+            extract = _compile_extractor(False, config)
+            self.assertEqual(extract(request), (None, None, None))
+            config.token_location = ['headers', 'headers', 'cookies']
+            extract = _compile_extractor(False, config)
+            self.assertEqual(extract(request), (self.access_token, None, None))
+            self.assertEqual(
+                extract(self.factory.get('/user')), (None, None, None)
+            )
+        finally:
+            config.token_location = origin
+
+    def test_header_case(self):
+        """Header names are found in any case"""
+        for key in ('HTTP_AUTHORIZATION', 'HTTP_Authorization'):
+            request = self.factory.get(
+                '/user', **{key: "Bearer " + self.access_token}
+            )
+            self.assertEqual(user(request).status_code, 200)
+
     def _get_tokens(self):
         request = self.factory.get('/login')
         response = login(request)
@@ -0,0 +1,92 @@
+import unittest, json
+from datetime import timedelta
+from django.apps import apps
+from django.test import RequestFactory
+from django_jwt_extended import jwt_required, create_access_token
+from django_jwt_extended.exceptions import (
+    InvalidFresh,
+    InvalidScopes,
+    InvalidRoles,
+)
+from tests.sample.views import scoped_user, fresh_user
+
+
+class AuthorizationTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.factory = RequestFactory()
+        self.config = apps.get_app_config('django_jwt_extended')
+
+    def _get(self, view, token):
+        return view(self.factory.get(
+            '/user', HTTP_Authorization="Bearer " + token
+        ))
+
+    def _scoped(self, claims):
+        return self._get(
+            scoped_user, create_access_token('iml', additional_claims=claims)
+        )
+
+    def test_scopes_and_roles(self):
+        """Every scope and one of the roles are required"""
+        for claims in (
+            {'scope': 'read write admin', 'roles': ['staff']},
+            {'scope': ['write', 'read'], 'roles': 'admin'},
+        ):
+            self.assertEqual(self._scoped(claims).status_code, 200)
+
+        for claims in (
+            {'roles': ['admin']},
+            {'scope': 'read', 'roles': ['admin']},
+            {'scope': 42, 'roles': ['admin']},
+        ):
+            response = self._scoped(claims)
+            self.assertEqual(response.status_code, 403)
+            self.assertEqual(
+                json.loads(response.content), self.config.insufficient_scope_msg
+            )
+            self.assertNotIn('WWW-Authenticate', response)
+
+        for claims in (
+            {'scope': 'read write'},
+            {'scope': 'read write', 'roles': ['user']},
+        ):
+            response = self._scoped(claims)
+            self.assertEqual(response.status_code, 403)
+            self.assertEqual(
+                json.loads(response.content), self.config.missing_role_msg
+            )
+
+    def test_fresh(self):
+        """Fresh tokens are required"""
+        fresh = create_access_token('iml', fresh=True)
+        self.assertEqual(self._get(fresh_user, fresh).status_code, 200)
+        fresh = create_access_token('iml', fresh=timedelta(minutes=5))
+        self.assertEqual(self._get(fresh_user, fresh).status_code, 200)
+
+        for token in (
+            create_access_token('iml'),
+            create_access_token(
+                'iml', additional_claims={'roles': ['admin']}
+            ),
+        ):
+            response = self._get(fresh_user, token)
+            self.assertEqual(response.status_code, 401)
+            self.assertEqual(
+                json.loads(response.content),
+                self.config.fresh_token_required_msg,
+            )
+
+    def test_invalid_requirements(self):
+        """Requirements are validated at decoration time"""
+        for kwargs, exception in (
+            ({'fresh': 1}, InvalidFresh),
+            ({'scopes': 'read'}, InvalidScopes),
+            ({'roles': [1]}, InvalidRoles),
+        ):
+            with self.assertRaises(exception):
+                jwt_required(**kwargs)
+
+
+if __name__ == '__main__':
+    unittest.main()
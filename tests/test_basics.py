@@ -1,5 +1,7 @@
 import unittest
 from django.apps import apps
+from django.test import RequestFactory
+from django_jwt_extended.request import _compile_request_finder
 
 class BasicsTestCase(unittest.TestCase):
 
@@ -32,5 +34,25 @@ class BasicsTestCase(unittest.TestCase):
         for key in keys:
             self.assertTrue(hasattr(self.config, key))
 
+    def test_request_finder(self):
+        """Find the request argument by the view signature"""
+        request = RequestFactory().get('/')
+
+        def view(request, pk): pass
+        def method(self, request): pass
+        def named(self, other, request): pass
+        def renamed(req): pass
+        def variadic(*args, **kwargs): pass
+
+        self.assertIs(_compile_request_finder(view)(request, 1), request)
+        self.assertIs(_compile_request_finder(view)(request=request, pk=1), request)
+        self.assertIs(_compile_request_finder(method)(object(), request), request)
+        self.assertIs(_compile_request_finder(named)(1, 2, request), request)
+        self.assertIs(_compile_request_finder(renamed)(request), request)
+        # 시그니처와 다른 호출은 모든 인자를 검사
+        self.assertIs(_compile_request_finder(variadic)(1, x=request), request)
+        self.assertIs(_compile_request_finder(view)(1, request), request)
+        self.assertIsNone(_compile_request_finder(method)(object(), 1))
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,79 @@
+import unittest, json, time
+from django.test import RequestFactory
+from django.apps import apps
+from django_jwt_extended import create_access_token
+from django_jwt_extended.cache import TokenCache
+from django_jwt_extended.clock import FrozenClock
+from django_jwt_extended.config import ConfigParser
+from django_jwt_extended.exceptions import InvalidTokenCache
+from tests.sample.views import login, user
+
+
+class TokenCacheTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.factory = RequestFactory()
+        self.config = apps.get_app_config('django_jwt_extended')
+        self.origin_cache = self.config.token_cache, self.config.clock
+        self.config.token_cache = TokenCache(maxsize=2, ttl=60)
+
+    def tearDown(self):
+        self.config.token_cache, self.config.clock = self.origin_cache
+
+    def test_cache_hit(self):
+        """Verified payload is reused on repeat requests"""
+        tokens = json.loads(login(self.factory.get('/login')).content)
+        for _ in range(3):
+            request = self.factory.get(
+                '/user',
+                HTTP_Authorization="Bearer " + tokens['access_token']
+            )
+            self.assertEqual(user(request).status_code, 200)
+        info = self.config.token_cache.info()
+        self.assertEqual(info['misses'], 1)
+        self.assertEqual(info['hits'], 2)
+
+    def test_cache_bounded(self):
+        """Least recently used entry is evicted"""
+        cache = self.config.token_cache
+        exp = time.time() + 60
+        for token in ('a', 'b', 'c'):
+            cache.set(token, {'exp': exp})
+        self.assertIsNone(cache.get('a'))
+        self.assertIsNotNone(cache.get('c'))
+        self.assertEqual(cache.info()['size'], 2)
+
+    def test_cache_expires_with_token(self):
+        """Entry never outlives the token exp"""
+        cache = self.config.token_cache
+        cache.set('expired', {'exp': time.time() - 1})
+        self.assertIsNone(cache.get('expired'))
+
+    def test_cache_hit_uses_clock(self):
+        """Cached tokens expire by the configured CLOCK"""
+        clock = self.config.clock = FrozenClock(int(time.time()))
+        token = create_access_token('iml', expires_delta=60)
+        request = lambda: self.factory.get(
+            '/user', HTTP_AUTHORIZATION="Bearer " + token
+        )
+        self.assertEqual(user(request()).status_code, 200)
+        clock.tick(61)
+        response = user(request())
+        self.assertEqual(response.status_code, 401)
+        self.assertEqual(
+            json.loads(response.content), self.config.expired_token_msg
+        )
+        self.assertEqual(self.config.token_cache.info()['hits'], 1)
+
+    def test_valid_cache_config(self):
+        """Validate Token Cache config"""
+        ConfigParser.validate_token_cache_size({'TOKEN_CACHE_SIZE': 1024})
+        ConfigParser.validate_token_cache_ttl({'TOKEN_CACHE_TTL': 60})
+        with self.assertRaises(InvalidTokenCache):
+            ConfigParser.validate_token_cache_size({'TOKEN_CACHE_SIZE': -1})
+        with self.assertRaises(InvalidTokenCache):
+            ConfigParser.validate_token_cache_ttl({'TOKEN_CACHE_TTL': 0})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -5,6 +5,14 @@ from django_jwt_extended.exceptions import (
     InvalidJwtAlgorithm,
     InvalidLocation,
     InvalidExpires,
+    InvalidErrorStatus,
+    InvalidJsonFormat,
+    InvalidCompactTokens,
+    InvalidCookie,
+    InvalidSlidingRefresh,
+    InvalidLeeway,
+    InvalidClock,
+    InvalidProfile,
 )
 from django.apps import apps
 
@@ -69,6 +77,115 @@ class ConfigParserTestCase(unittest.TestCase):
             except InvalidExpires:
                 pass
         
+    def test_valid_error_status(self):
+        """Validate Error status codes config"""
+        errors = self.config_parser.customize_error({})
+        status = self.config_parser.validate_error_status(
+            {'ERROR_STATUS_CODES': {'EXPIRED_TOKEN_MSG': 419}}, errors
+        )
+        self.assertEqual(status['EXPIRED_TOKEN_MSG'], 419)
+        self.assertEqual(status['JWT_NOT_FOUND_MSG'], 401)
+        self.assertEqual(status['INSUFFICIENT_SCOPE_MSG'], 403)
+        for invalid in ({'UNKNOWN_MSG': 401}, {'EXPIRED_TOKEN_MSG': 200}):
+            with self.assertRaises(InvalidErrorStatus):
+                self.config_parser.validate_error_status(
+                    {'ERROR_STATUS_CODES': invalid}, errors
+                )
+
+    def test_valid_compact_tokens(self):
+        """Validate Compact token profile config"""
+        self.assertFalse(self.config_parser.validate_compact_tokens({}))
+        self.assertEqual(
+            self.config_parser.validate_omit_claims(
+                {'OMIT_CLAIMS': ['iat', 'jti']}, None
+            ),
+            ('iat', 'jti'),
+        )
+        with self.assertRaises(InvalidCompactTokens):
+            self.config_parser.validate_compact_tokens({'COMPACT_TOKENS': 1})
+        for claims, revocation in (
+            (['exp'], None), ('iat', None), (['jti'], {'backend': 'x'}),
+        ):
+            with self.assertRaises(InvalidCompactTokens):
+                self.config_parser.validate_omit_claims(
+                    {'OMIT_CLAIMS': claims}, revocation
+                )
+
+    def test_valid_cookies(self):
+        """Validate Cookie config"""
+        cookies = self.config_parser.validate_cookies({
+            'COOKIE_SECURE': True, 'CSRF_METHODS': ['post'],
+        })
+        self.assertTrue(cookies['cookie_secure'])
+        self.assertFalse(cookies['cookie_csrf_protect'])
+        self.assertEqual(cookies['csrf_methods'], frozenset(['POST']))
+        for invalid in (
+            {'COOKIE_SECURE': 'yes'},
+            {'COOKIE_SAMESITE': 'Loose'},
+            {'COOKIE_DOMAIN': 1},
+            {'CSRF_METHODS': 'POST'},
+        ):
+            with self.assertRaises(InvalidCookie):
+                self.config_parser.validate_cookies(invalid)
+
+    def test_valid_sliding_refresh(self):
+        """Validate Sliding refresh config"""
+        self.assertIsNone(self.config_parser.validate_sliding_refresh({}))
+        sliding = self.config_parser.validate_sliding_refresh(
+            {'SLIDING_REFRESH_WINDOW': timedelta(minutes=5)}
+        )
+        self.assertEqual(sliding['window'], 300)
+        self.assertEqual(sliding['location'], 'headers')
+        for invalid in (
+            {'SLIDING_REFRESH_WINDOW': 0},
+            {'SLIDING_REFRESH_WINDOW': 60, 'SLIDING_REFRESH_LOCATION': 'body'},
+        ):
+            with self.assertRaises(InvalidSlidingRefresh):
+                self.config_parser.validate_sliding_refresh(invalid)
+
+    def test_valid_clock(self):
+        """Validate Leeway and Clock config"""
+        self.assertEqual(self.config_parser.validate_leeway({}), 0)
+        self.assertEqual(
+            self.config_parser.validate_leeway({'LEEWAY': timedelta(seconds=30)}),
+            30,
+        )
+        with self.assertRaises(InvalidLeeway):
+            self.config_parser.validate_leeway({'LEEWAY': -1})
+        self.config_parser.validate_clock({'CLOCK': lambda: 0})
+        with self.assertRaises(InvalidClock):
+            self.config_parser.validate_clock({'CLOCK': 1700000000})
+
+    def test_valid_profiles(self):
+        """Validate Issuer, Audience and Profiles config"""
+        profiles = self.config_parser.validate_profiles({
+            'AUDIENCE': 'web',
+            'PROFILES': {'mobile': {'AUDIENCE': ['mobile', 'tablet']}},
+        })
+        self.assertEqual(profiles[None].audience_claim, 'web')
+        self.assertEqual(profiles['mobile'].audience_claim, ('mobile', 'tablet'))
+        self.assertIsNone(profiles['mobile'].issuer)
+        for invalid in (
+            {'ISSUER': 1},
+            {'AUDIENCE': []},
+            {'PROFILES': ['mobile']},
+            {'PROFILES': {'mobile': 'mobile'}},
+            {'PROFILES': {'mobile': {'LOCATION': ['headers']}}},
+        ):
+            with self.assertRaises(InvalidProfile):
+                self.config_parser.validate_profiles(invalid)
+        with self.assertRaises(InvalidExpires):
+            self.config_parser.validate_profiles(
+                {'PROFILES': {'mobile': {'ACCESS_TOKEN_EXPIRES': 0}}}
+            )
+
+    def test_valid_error_json(self):
+        """Validate Error message config"""
+        with self.assertRaises(InvalidJsonFormat):
+            self.config_parser.customize_error(
+                {'JWT_NOT_FOUND_MSG': {'msg': object()}}
+            )
+
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
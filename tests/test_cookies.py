@@ -0,0 +1,116 @@
+import unittest, json
+from django.apps import apps
+from django.http import JsonResponse
+from django.test import RequestFactory
+from django_jwt_extended import (
+    create_access_token,
+    create_token_pair,
+    set_access_cookies,
+    set_refresh_cookies,
+    unset_jwt_cookies,
+)
+from django_jwt_extended.tokens import _compile_verifier
+from tests.sample.views import user, refresh
+
+
+class CookieTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.factory = RequestFactory()
+        self.config = apps.get_app_config('django_jwt_extended')
+        self.origin = (self.config.csrf_protect, self.config.verifiers)
+        self._protect(True)
+
+    def tearDown(self):
+        self.config.csrf_protect, self.config.verifiers = self.origin
+
+    def _protect(self, csrf_protect):
+        self.config.csrf_protect = csrf_protect
+        self.config.verifiers = {
+            refresh: _compile_verifier(refresh, self.config)
+            for refresh in (False, True)
+        }
+
+    def _login(self):
+        access_token, refresh_token = create_token_pair('iml')
+        response = JsonResponse({})
+        set_access_cookies(response, access_token)
+        set_refresh_cookies(response, refresh_token)
+        return response.cookies
+
+    def _request(self, method, cookies, **extra):
+        request = getattr(self.factory, method)('/user', **extra)
+        request.COOKIES = {name: cookie.value for name, cookie in cookies.items()}
+        return request
+
+    def test_set_cookies(self):
+        """Set token and CSRF cookies with the configured attributes"""
+        cookies = self._login()
+        self.assertEqual(
+            set(cookies),
+            {'access_token', 'refresh_token',
+             'csrf_access_token', 'csrf_refresh_token'},
+        )
+        access = cookies['access_token']
+        self.assertTrue(access['httponly'])
+        self.assertEqual(access['samesite'], 'Lax')
+        self.assertEqual(access['path'], '/')
+        self.assertEqual(
+            access['max-age'],
+            int(self.config.access_token_expires.total_seconds()),
+        )
+        self.assertFalse(cookies['csrf_access_token']['httponly'])
+
+        response = JsonResponse({})
+        set_access_cookies(response, create_access_token('iml'), max_age=60)
+        self.assertEqual(response.cookies['access_token']['max-age'], 60)
+
+    def test_csrf_double_submit(self):
+        """Unsafe methods with cookie tokens need the CSRF header"""
+        cookies = self._login()
+        csrf = cookies['csrf_access_token'].value
+
+        self.assertEqual(user(self._request('get', cookies)).status_code, 200)
+        for extra in ({}, {'HTTP_X_CSRF_TOKEN': 'forged'}):
+            response = user(self._request('post', cookies, **extra))
+            self.assertEqual(response.status_code, 401)
+            self.assertEqual(
+                json.loads(response.content), self.config.csrf_error_msg
+            )
+        response = user(self._request('post', cookies, HTTP_X_CSRF_TOKEN=csrf))
+        self.assertEqual(response.status_code, 200)
+
+        # refresh 토큰은 자신의 CSRF 쿠키 값을 사용
+        response = refresh(self._request('post', cookies, HTTP_X_CSRF_TOKEN=csrf))
+        self.assertEqual(response.status_code, 401)
+        response = refresh(self._request(
+            'post', cookies,
+            HTTP_X_CSRF_TOKEN=cookies['csrf_refresh_token'].value,
+        ))
+        self.assertEqual(response.status_code, 200)
+
+    def test_header_tokens_skip_csrf(self):
+        """Header tokens are not subject to CSRF"""
+        request = self.factory.post(
+            '/user', HTTP_AUTHORIZATION='Bearer ' + create_access_token('iml')
+        )
+        self.assertEqual(user(request).status_code, 200)
+
+    def test_not_protected(self):
+        """No CSRF claim or cookie without COOKIE_CSRF_PROTECT"""
+        self._protect(False)
+        cookies = self._login()
+        self.assertNotIn('csrf_access_token', cookies)
+        self.assertEqual(user(self._request('post', cookies)).status_code, 200)
+
+    def test_unset_cookies(self):
+        """Delete every cookie"""
+        response = unset_jwt_cookies(JsonResponse({}))
+        self.assertEqual(len(response.cookies), 4)
+        for cookie in response.cookies.values():
+            self.assertEqual(cookie.value, '')
+            self.assertEqual(cookie['max-age'], 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,100 @@
+import unittest
+from unittest import mock
+from django.apps import apps
+from django.test import RequestFactory
+from rest_framework.throttling import UserRateThrottle
+from django_jwt_extended import (
+    create_access_token,
+    create_refresh_token,
+    user_lookup_loader,
+)
+from django_jwt_extended import tokens
+from django_jwt_extended.authentication import TokenUser
+from tests.sample.views import RestAuthenticatedView
+
+
+class DRFAuthenticationTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.factory = RequestFactory()
+        self.config = apps.get_app_config('django_jwt_extended')
+        self.view = RestAuthenticatedView.as_view()
+        self.origin = tokens._user_lookup
+
+    def tearDown(self):
+        tokens._user_lookup = self.origin
+
+    def _get(self, token=None, **kwargs):
+        if token is not None:
+            kwargs['HTTP_Authorization'] = "Bearer " + token
+        return self.view(self.factory.get('/rest-auth', **kwargs))
+
+    def _admin_token(self):
+        return create_access_token(
+            'iml', additional_claims={'roles': ['admin']}
+        )
+
+    def test_authenticated(self):
+        """Authenticate with a token user"""
+        response = self._get(self._admin_token())
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['id'], 'iml')
+        self.assertEqual(response.data['raw_jwt']['roles'], ['admin'])
+
+    def test_decoded_once(self):
+        """Authentication and permissions share one verification"""
+        verifier = self.config.verifiers[False]
+        with mock.patch.dict(
+            self.config.verifiers, {False: mock.Mock(wraps=verifier)}
+        ):
+            self.assertEqual(self._get(self._admin_token()).status_code, 200)
+            self.assertEqual(self.config.verifiers[False].call_count, 1)
+
+    def test_not_authenticated(self):
+        """Rejected tokens get the configured error responses"""
+        response = self._get()
+        self.assertEqual(response.status_code, 401)
+        self.assertEqual(response['WWW-Authenticate'], 'Bearer')
+
+        response = self._get(create_refresh_token('iml'))
+        self.assertEqual(response.status_code, 401)
+        self.assertEqual(
+            response.data, self.config.invalid_token_type_msg
+        )
+
+        response = self._get(create_access_token('iml'))
+        self.assertEqual(response.status_code, 403)
+        self.assertEqual(
+            response.data, self.config.missing_role_msg
+        )
+
+    def test_user_lookup(self):
+        """Authenticate with the registered user lookup"""
+        user_lookup_loader(
+            lambda identity: TokenUser({'sub': 'looked-up'})
+            if identity == 'iml' else None
+        )
+        response = self._get(self._admin_token())
+        self.assertEqual(response.data['id'], 'looked-up')
+
+        token = create_access_token(
+            'ghost', additional_claims={'roles': ['admin']}
+        )
+        response = self._get(token)
+        self.assertEqual(response.status_code, 401)
+        self.assertEqual(
+            response.data, self.config.user_not_found_msg
+        )
+
+    def test_throttle_identity(self):
+        """Throttles identify token users by identity"""
+        request = mock.Mock(user=TokenUser({'sub': 'iml'}))
+        throttle = UserRateThrottle.__new__(UserRateThrottle)
+        throttle.scope = 'user'
+        self.assertEqual(
+            throttle.get_cache_key(request, None), 'throttle_user_iml'
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,70 @@
+import unittest, json
+from django.apps import apps
+from django.test import RequestFactory
+from django_jwt_extended import instrumentation
+from django_jwt_extended.instrumentation import MetricsCollector
+from django_jwt_extended.exceptions import InvalidEvent
+from django_jwt_extended.views import metrics
+from tests.sample.views import login, user, refresh
+
+
+class InstrumentationTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.factory = RequestFactory()
+        self.config = apps.get_app_config('django_jwt_extended')
+        self.origin = self.config.metrics
+        self.config.metrics = self.collector = MetricsCollector()
+        self.collector.connect()
+
+    def tearDown(self):
+        self.collector.disconnect()
+        self.config.metrics = self.origin
+
+    def test_outcomes(self):
+        """Count locations, outcomes and issued tokens"""
+        tokens = json.loads(login(self.factory.get('/login')).content)
+        user(self.factory.get(
+            '/user', HTTP_AUTHORIZATION="Bearer " + tokens['access_token']
+        ))
+        request = self.factory.get('/user')
+        request.COOKIES = {'access_token': tokens['refresh_token']}
+        user(request)
+        user(self.factory.get('/user'))
+        refresh(self.factory.get('/refresh', HTTP_AUTHORIZATION="Token"))
+
+        self.assertEqual(
+            self.collector.token_found.values, {'headers': 2, 'cookies': 1}
+        )
+        self.assertEqual(self.collector.verified.values, {
+            'ok': 1, 'wrong_type': 1, 'missing': 1, 'bearer': 1,
+        })
+        self.assertEqual(
+            self.collector.issued.values, {'access': 1, 'refresh': 1}
+        )
+        self.assertEqual(sum(self.collector.decode_seconds.counts), 2)
+
+    def test_render(self):
+        """Render Prometheus text format"""
+        login(self.factory.get('/login'))
+        response = metrics(self.factory.get('/metrics'))
+        self.assertEqual(response.status_code, 200)
+        body = response.content.decode()
+        self.assertIn('jwt_tokens_issued_total{type="access"} 1', body)
+        self.assertIn('jwt_decode_seconds_bucket{le="+Inf"} 0', body)
+
+    def test_disconnected(self):
+        """Nothing is recorded once disconnected"""
+        self.collector.disconnect()
+        login(self.factory.get('/login'))
+        self.assertEqual(self.collector.issued.values, {})
+        self.collector.connect()
+
+    def test_invalid_event(self):
+        """Validate event name"""
+        with self.assertRaises(InvalidEvent):
+            instrumentation.connect('unknown', print)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,209 @@
+import unittest
+import jwt
+from django.conf import settings
+from django.test import RequestFactory
+import json
+from django.apps import apps
+from datetime import timedelta
+from django_jwt_extended import (
+    additional_claims_loader,
+    create_access_token,
+    create_refresh_token,
+    create_tokens_bulk,
+    create_token_pair,
+)
+from django_jwt_extended.exceptions import (
+    InvalidTokenType,
+    InvalidExpires,
+    InvalidClaims,
+)
+from django_jwt_extended.tokens import _claims_loaders
+from tests.sample.views import user, refresh, login_pair
+
+
+class IssuanceTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.factory = RequestFactory()
+
+    def tearDown(self):
+        pass
+
+    def _decode(self, token):
+        return jwt.decode(token, settings.SECRET_KEY, ['HS256'])
+
+    def test_token_pair(self):
+        """Issue linked access and refresh tokens"""
+        pair = create_token_pair('iml')
+        access = self._decode(pair.access_token)
+        refresh_payload = self._decode(pair.refresh_token)
+        self.assertEqual(access['jti'], pair.access_jti)
+        self.assertEqual(access['pjti'], refresh_payload['jti'])
+        self.assertEqual(refresh_payload['pjti'], access['jti'])
+        self.assertEqual(access['iat'], refresh_payload['iat'])
+        self.assertLess(access['exp'], refresh_payload['exp'])
+
+        tokens = json.loads(login_pair(self.factory.get('/login')).content)
+        request = self.factory.get(
+            '/user', HTTP_Authorization="Bearer " + tokens['access_token']
+        )
+        self.assertEqual(user(request).status_code, 200)
+        request = self.factory.get(
+            '/refresh', HTTP_Authorization="Bearer " + tokens['refresh_token']
+        )
+        self.assertEqual(refresh(request).status_code, 200)
+
+    def test_bulk_tokens(self):
+        """Issue tokens in bulk"""
+        identities = ['device-%d' % i for i in range(10)]
+        tokens = list(create_tokens_bulk(identities))
+        self.assertEqual(
+            [self._decode(token)['sub'] for token in tokens], identities
+        )
+        self.assertEqual(len({self._decode(t)['jti'] for t in tokens}), 10)
+
+        request = self.factory.get(
+            '/user', HTTP_Authorization="Bearer " + tokens[0]
+        )
+        self.assertEqual(user(request).status_code, 200)
+
+    def test_bulk_refresh_tokens(self):
+        """Issue refresh tokens in bulk"""
+        token = next(create_tokens_bulk(['iml'], type='refresh'))
+        request = self.factory.get(
+            '/refresh', HTTP_Authorization="Bearer " + token
+        )
+        self.assertEqual(refresh(request).status_code, 200)
+        # 제너레이터를 소비하기 전, 호출 시점에 검증
+        with self.assertRaises(InvalidTokenType):
+            create_tokens_bulk(['iml'], type='bad')
+
+    def test_bulk_tokens_process_pool(self):
+        """Issue tokens in bulk over a process pool"""
+        identities = [str(i) for i in range(25)]
+        tokens = list(
+            create_tokens_bulk(identities, processes=2, chunksize=10)
+        )
+        self.assertEqual(
+            [self._decode(token)['sub'] for token in tokens], identities
+        )
+
+
+class ClaimsTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.factory = RequestFactory()
+        self.loaded = []
+
+        @additional_claims_loader
+        def load_roles(identity):
+            self.loaded.append(identity)
+            return {'roles': ['admin'], 'tenant': 1}
+        self.loader = load_roles
+
+    def tearDown(self):
+        _claims_loaders.remove(self.loader)
+
+    def _decode(self, token):
+        return jwt.decode(token, settings.SECRET_KEY, ['HS256'])
+
+    def test_additional_claims(self):
+        """Embed loader and additional claims in access tokens"""
+        payload = self._decode(
+            create_access_token('iml', additional_claims={'tenant': 2})
+        )
+        self.assertEqual(payload['roles'], ['admin'])
+        self.assertEqual(payload['tenant'], 2)
+        self.assertNotIn('roles', self._decode(create_refresh_token('iml')))
+
+        pair = create_token_pair('iml')
+        self.assertEqual(self._decode(pair.access_token)['roles'], ['admin'])
+        self.assertNotIn('roles', self._decode(pair.refresh_token))
+        self.assertEqual(self.loaded, ['iml', 'iml'])
+
+        with self.assertRaises(InvalidClaims):
+            create_access_token('iml', additional_claims={'sub': 'admin'})
+
+    def test_expires_delta_and_fresh(self):
+        """Per token expiry and freshness"""
+        payload = self._decode(create_access_token(
+            'iml', fresh=True, expires_delta=timedelta(minutes=5)
+        ))
+        self.assertEqual(payload['exp'] - payload['iat'], 300)
+        self.assertIs(payload['fresh'], True)
+
+        payload = self._decode(
+            create_access_token('iml', fresh=timedelta(minutes=15))
+        )
+        self.assertEqual(payload['fresh'] - payload['iat'], 900)
+        self.assertNotIn('fresh', self._decode(create_access_token('iml')))
+
+        payload = self._decode(create_refresh_token('iml', expires_delta=60))
+        self.assertEqual(payload['exp'] - payload['iat'], 60)
+        for invalid in (0, True, 'never'):
+            with self.assertRaises(InvalidExpires):
+                create_access_token('iml', expires_delta=invalid)
+
+
+class CompactTokenTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.factory = RequestFactory()
+        self.config = apps.get_app_config('django_jwt_extended')
+        self.origin = (self.config.compact_tokens, self.config.omit_claims)
+        self.config.compact_tokens = True
+
+    def tearDown(self):
+        self.config.compact_tokens, self.config.omit_claims = self.origin
+
+    def _decode(self, token):
+        return jwt.decode(token, settings.SECRET_KEY, ['HS256'])
+
+    def test_compact_payload(self):
+        """Compact tokens are shorter and still verified"""
+        token = create_access_token('iml')
+        payload = self._decode(token)
+        self.assertEqual(set(payload), {'iat', 'jti', 'type', 'sub', 'exp'})
+        self.assertEqual(payload['type'], 'a')
+        self.assertEqual(len(payload['jti']), 22)
+        self.config.compact_tokens = False
+        self.assertLess(len(token), len(create_access_token('iml')))
+
+        response = user(self.factory.get(
+            '/user', HTTP_Authorization="Bearer " + token
+        ))
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(json.loads(response.content)['raw_jwt']['type'], 'access')
+
+    def test_compact_token_type(self):
+        """Compact refresh tokens are refused as access tokens"""
+        token = create_refresh_token('iml')
+        self.assertEqual(self._decode(token)['type'], 'r')
+        response = user(self.factory.get(
+            '/user', HTTP_Authorization="Bearer " + token
+        ))
+        self.assertEqual(
+            json.loads(response.content), self.config.invalid_token_type_msg
+        )
+        response = refresh(self.factory.get(
+            '/refresh', HTTP_Authorization="Bearer " + token
+        ))
+        self.assertEqual(response.status_code, 200)
+
+    def test_omit_claims(self):
+        """OMIT_CLAIMS drops claims, token pairs keep their jti"""
+        self.config.omit_claims = ('iat', 'jti')
+        payload = self._decode(create_access_token('iml'))
+        self.assertEqual(set(payload), {'type', 'sub', 'exp'})
+
+        pair = create_token_pair('iml')
+        access = self._decode(pair.access_token)
+        self.assertEqual(set(access), {'jti', 'type', 'sub', 'exp', 'pjti'})
+        response = user(self.factory.get(
+            '/user', HTTP_Authorization="Bearer " + pair.access_token
+        ))
+        self.assertEqual(response.status_code, 200)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,180 @@
+import unittest, json
+from jwt.exceptions import InvalidSignatureError
+from jwt.utils import base64url_encode
+from django.test import RequestFactory
+from django.apps import apps
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import ec, ed25519
+from django_jwt_extended.config import load_keys, ConfigParser
+from django_jwt_extended.keys import (
+    JwtKey,
+    load_keyring,
+    index_segments,
+    build_jwks,
+)
+from django_jwt_extended.views import jwks
+from django_jwt_extended.tokens import _resolve_key
+from django_jwt_extended.exceptions import (
+    NotFoundKey,
+    NotFoundPrivateKey,
+    InvalidKey,
+)
+from tests.sample.views import login, user
+
+
+def generate_pem(private_key):
+    private_pem = private_key.private_bytes(
+        serialization.Encoding.PEM,
+        serialization.PrivateFormat.PKCS8,
+        serialization.NoEncryption(),
+    )
+    public_pem = private_key.public_key().public_bytes(
+        serialization.Encoding.PEM,
+        serialization.PublicFormat.SubjectPublicKeyInfo,
+    )
+    return private_pem, public_pem
+
+
+class KeyTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.factory = RequestFactory()
+        self.config = apps.get_app_config('django_jwt_extended')
+        self.origin = (
+            self.config.keys, self.config.active_key, self.config.key_segments
+        )
+
+    def tearDown(self):
+        (
+            self.config.keys, self.config.active_key, self.config.key_segments
+        ) = self.origin
+
+    def _set_keyring(self, keys, active_key):
+        self.config.keys, self.config.active_key = keys, active_key
+        self.config.key_segments = index_segments(keys.values())
+
+    def _use(self, algorithm, signing_key, verifying_key):
+        key = JwtKey(None, algorithm, signing_key, verifying_key)
+        self._set_keyring({None: key}, key)
+
+    def _auth(self):
+        response = login(self.factory.get('/login'))
+        access_token = json.loads(response.content)['access_token']
+        request = self.factory.get(
+            '/user',
+            HTTP_Authorization="Bearer " + access_token
+        )
+        return user(request)
+
+
+class AsymmetricKeyTestCase(KeyTestCase):
+
+    def test_es256(self):
+        """Run Authentication with ES256 key objects"""
+        private_pem, public_pem = generate_pem(
+            ec.generate_private_key(ec.SECP256R1())
+        )
+        self._use(*(('ES256',) + load_keys('ES256', None, private_pem, public_pem)))
+        self.assertEqual(self._auth().status_code, 200)
+
+    def test_eddsa_public_key_derived(self):
+        """Public key is derived when only the private key is given"""
+        private_pem, _ = generate_pem(ed25519.Ed25519PrivateKey.generate())
+        signing_key, verifying_key = load_keys('EdDSA', None, private_pem)
+        self.assertIsNotNone(verifying_key)
+        self._use('EdDSA', signing_key, verifying_key)
+        self.assertEqual(self._auth().status_code, 200)
+
+    def test_verify_only_node(self):
+        """Node without private key cannot issue tokens"""
+        _, public_pem = generate_pem(ec.generate_private_key(ec.SECP256R1()))
+        signing_key, verifying_key = load_keys('ES256', None, None, public_pem)
+        self.assertIsNone(signing_key)
+        self._use('ES256', signing_key, verifying_key)
+        with self.assertRaises(NotFoundPrivateKey):
+            login(self.factory.get('/login'))
+
+    def test_invalid_keys(self):
+        """Validate key config"""
+        self.assertEqual(load_keys('HS256', 'secret'), ('secret', 'secret'))
+        with self.assertRaises(NotFoundKey):
+            load_keys('RS256', 'secret')
+        with self.assertRaises(InvalidKey):
+            load_keys('RS256', 'secret', 'not a pem')
+
+
+class KeyRotationTestCase(KeyTestCase):
+
+    def _keyring(self, *kids):
+        entries = []
+        for kid in kids:
+            private_pem, _ = generate_pem(
+                ec.generate_private_key(ec.SECP256R1())
+            )
+            entries.append({
+                'KID': kid, 'ALGORITHM': 'ES256', 'PRIVATE_KEY': private_pem,
+            })
+        entries.append({'KID': 'legacy', 'ALGORITHM': 'HS256'})
+        return ConfigParser.validate_keys({'KEYS': entries})
+
+    def test_rotation(self):
+        """Tokens of the previous key stay valid after rotation"""
+        entries = self._keyring('2026-q3')
+        self._set_keyring(*load_keyring(entries, 'secret'))
+        response = login(self.factory.get('/login'))
+        old_token = json.loads(response.content)['access_token']
+
+        entries = self._keyring('2026-q4') + entries[:1]
+        self._set_keyring(*load_keyring(entries, 'secret'))
+        self.assertEqual(self._auth().status_code, 200)
+        request = self.factory.get(
+            '/user', HTTP_Authorization="Bearer " + old_token
+        )
+        self.assertEqual(user(request).status_code, 200)
+
+        entries = entries[:1]
+        self._set_keyring(*load_keyring(
+            entries + self._keyring('2027-q1'), 'secret'
+        ))
+        request = self.factory.get(
+            '/user', HTTP_Authorization="Bearer " + old_token
+        )
+        self.assertEqual(user(request).status_code, 401)
+
+    def test_key_segments(self):
+        """Keyring headers resolve by lookup, others are never stored"""
+        entries = self._keyring('2026-q3')
+        self._set_keyring(*load_keyring(entries, 'secret'))
+        for i in range(300):
+            junk = base64url_encode(
+                json.dumps({'alg': 'HS256', 'kid': str(i)}).encode()
+            ).decode()
+            with self.assertRaises(InvalidSignatureError):
+                _resolve_key(junk + '.e30.', self.config)
+        self.assertEqual(len(self.config.key_segments), 2)
+        access_token = json.loads(
+            login(self.factory.get('/login')).content
+        )['access_token']
+        self.assertIs(
+            _resolve_key(access_token, self.config), self.config.active_key
+        )
+
+    def test_jwks(self):
+        """JWKS publishes public keys only, with ETag"""
+        keys, _ = load_keyring(self._keyring('a', 'b'), 'secret')
+        body, etag = build_jwks(keys.values())
+        document = json.loads(body)
+        self.assertEqual([key['kid'] for key in document['keys']], ['a', 'b'])
+        self.assertTrue(all('d' not in key for key in document['keys']))
+
+        response = jwks(self.factory.get('/jwks'))
+        self.assertEqual(response.status_code, 200)
+        response = jwks(self.factory.get(
+            '/jwks', HTTP_IF_NONE_MATCH=response['ETag']
+        ))
+        self.assertEqual(response.status_code, 304)
+        self.assertIn('max-age', response['Cache-Control'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,185 @@
+import unittest, json, asyncio
+from datetime import timedelta
+from unittest import mock
+from django.apps import apps
+from django.test import RequestFactory
+from django_jwt_extended import (
+    tokens,
+    create_access_token,
+    additional_claims_loader,
+)
+from django_jwt_extended.clock import FrozenClock
+from django_jwt_extended.middleware import JWTAuthenticationMiddleware
+from tests.sample.views import (
+    login, user, async_user, decorator_user, mobile_user,
+)
+
+
+class MiddlewareTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.factory = RequestFactory()
+        response = login(self.factory.get('/login'))
+        self.access_token = json.loads(response.content)['access_token']
+
+    def tearDown(self):
+        pass
+
+    def _request(self):
+        return self.factory.get(
+            '/user',
+            HTTP_Authorization="Bearer " + self.access_token
+        )
+
+    def test_decode_once(self):
+        """Token is decoded once for stacked decorators"""
+        def get_response(request):
+            user(request)
+            return decorator_user(request)
+
+        middleware = JWTAuthenticationMiddleware(get_response)
+        with mock.patch.object(
+            tokens, '_decode_jwt_token', wraps=tokens._decode_jwt_token
+        ) as decode:
+            response = middleware(self._request())
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(decode.call_count, 1)
+
+    def test_async_middleware(self):
+        """Run middleware in async mode"""
+        async def get_response(request):
+            return await async_user(request)
+
+        middleware = JWTAuthenticationMiddleware(get_response)
+        self.assertTrue(asyncio.iscoroutinefunction(middleware))
+        response = asyncio.run(middleware(self._request()))
+        self.assertEqual(response.status_code, 200)
+
+    def test_lazy_decode(self):
+        """Token is not decoded unless a view asks for it"""
+        middleware = JWTAuthenticationMiddleware(lambda request: request)
+        with mock.patch.object(tokens, '_decode_jwt_token') as decode:
+            request = middleware(self._request())
+        self.assertIsInstance(request.jwt, tokens.JwtState)
+        decode.assert_not_called()
+
+
+class SlidingRefreshTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.factory = RequestFactory()
+        self.config = apps.get_app_config('django_jwt_extended')
+        self.origin = self.config.sliding_refresh, self.config.clock
+        self.config.sliding_refresh = {
+            'window': 600, 'location': 'headers', 'header': 'X-Access-Token',
+        }
+        self.middleware = JWTAuthenticationMiddleware(user)
+
+    def tearDown(self):
+        self.config.sliding_refresh, self.config.clock = self.origin
+
+    def _request(self, access_token):
+        return self.factory.get(
+            '/user', HTTP_Authorization="Bearer " + access_token
+        )
+
+    def _decode(self, access_token):
+        return tokens._decode_jwt_token(access_token, self.config)
+
+    def test_slide_near_expiry(self):
+        """Near expiry access tokens are replaced on the response"""
+        old = create_access_token(
+            'iml', fresh=True, expires_delta=60,
+            additional_claims={'roles': ['admin']},
+        )
+        response = self.middleware(self._request(old))
+        self.assertEqual(response.status_code, 200)
+        payload = self._decode(response['X-Access-Token'])
+        self.assertEqual(payload['sub'], 'iml')
+        self.assertEqual(payload['roles'], ['admin'])
+        self.assertNotIn('fresh', payload)
+        self.assertGreater(payload['exp'], self._decode(old)['exp'])
+
+    def test_slide_reloads_claims(self):
+        """Loader claims come from the loaders, not the old token"""
+        old = create_access_token(
+            'iml', expires_delta=60,
+            additional_claims={'roles': ['admin'], 'device': 'ios'},
+        )
+        loader = additional_claims_loader(lambda identity: {'roles': []})
+        try:
+            response = self.middleware(self._request(old))
+        finally:
+            tokens._claims_loaders.remove(loader)
+        payload = self._decode(response['X-Access-Token'])
+        self.assertEqual(payload['roles'], [])
+        self.assertEqual(payload['device'], 'ios')
+
+    def test_slide_session_lifetime(self):
+        """Tokens slide for at most REFRESH_TOKEN_EXPIRES after login"""
+        clock = self.config.clock = FrozenClock(1700000000)
+        lifetime = int(self.config.refresh_token_expires.total_seconds())
+        clock.tick(lifetime - 120)
+        token = create_access_token('iml', expires_delta=60)
+        old = self._decode(token)
+        old['oiat'] = 1700000000 - 1
+        response = self.middleware(self._request(
+            self.config.active_key.encode(old)
+        ))
+        payload = self._decode(response['X-Access-Token'])
+        # 연장은 최초 발급 시각 + REFRESH_TOKEN_EXPIRES 까지
+        self.assertEqual(payload['oiat'], 1700000000 - 1)
+        self.assertEqual(payload['exp'], 1700000000 - 1 + lifetime)
+
+        clock.tick(118)
+        response = self.middleware(self._request(
+            self.config.active_key.encode(payload)
+        ))
+        self.assertEqual(response.status_code, 200)
+        self.assertNotIn('X-Access-Token', response)
+
+    def test_slide_origin_carried(self):
+        """Slid tokens carry the issuance time of the first token"""
+        old = create_access_token('iml', expires_delta=60)
+        response = self.middleware(self._request(old))
+        payload = self._decode(response['X-Access-Token'])
+        self.assertEqual(payload['oiat'], self._decode(old)['iat'])
+
+    def test_no_slide(self):
+        """Tokens far from expiry and rejected requests are left alone"""
+        response = self.middleware(self._request(create_access_token('iml')))
+        self.assertNotIn('X-Access-Token', response)
+        response = self.middleware(self.factory.get('/user'))
+        self.assertNotIn('X-Access-Token', response)
+
+        self.config.sliding_refresh = None
+        token = create_access_token('iml', expires_delta=60)
+        response = self.middleware(self._request(token))
+        self.assertNotIn('X-Access-Token', response)
+
+    def test_slide_cookie(self):
+        """Slide into the access token cookie"""
+        self.config.sliding_refresh['location'] = 'cookies'
+        token = create_access_token('iml', expires_delta=timedelta(minutes=1))
+        response = self.middleware(self._request(token))
+        self.assertIn('access_token', response.cookies)
+
+    def test_slide_profile(self):
+        """Slide with the profile of the view that accepted the token"""
+        middleware = JWTAuthenticationMiddleware(mobile_user)
+        token = create_access_token('iml', expires_delta=60, profile='mobile')
+        response = middleware(self._request(token))
+        self.assertEqual(response.status_code, 200)
+        request = self._request(response['X-Access-Token'])
+        self.assertEqual(mobile_user(request).status_code, 200)
+
+    def test_slide_async(self):
+        """Slide in async mode"""
+        middleware = JWTAuthenticationMiddleware(async_user)
+        token = create_access_token('iml', expires_delta=60)
+        response = asyncio.run(middleware(self._request(token)))
+        self.assertIn('X-Access-Token', response)
+
+
+if __name__ == '__main__':
+    unittest.main()
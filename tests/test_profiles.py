@@ -0,0 +1,124 @@
+import unittest, json
+import jwt
+from django.apps import apps
+from django.conf import settings
+from django.test import RequestFactory
+from django_jwt_extended import (
+    jwt_required,
+    create_access_token,
+    create_refresh_token,
+    create_token_pair,
+    verify_jwt_in_request,
+)
+from django_jwt_extended.exceptions import InvalidProfile, JwtVerificationError
+from tests.sample.views import user, mobile_user
+
+
+class ProfileTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.factory = RequestFactory()
+        self.config = apps.get_app_config('django_jwt_extended')
+
+    def _get(self, view, token):
+        return view(self.factory.get(
+            '/user', HTTP_Authorization="Bearer " + token
+        ))
+
+    def _decode(self, token):
+        return jwt.decode(
+            token, settings.SECRET_KEY, ['HS256'],
+            options={'verify_aud': False},
+        )
+
+    def test_profiles_precomputed(self):
+        """Profiles are frozen and their verifiers compiled at startup"""
+        profile = self.config.profiles['mobile']
+        self.assertEqual(profile.audience, frozenset(('mobile', 'tablet')))
+        self.assertEqual(profile.access_token_expires, 3600)
+        # 지정하지 않은 설정은 JWT_CONFIG를 따름
+        self.assertEqual(
+            profile.refresh_token_expires,
+            self.config.profiles[None].refresh_token_expires,
+        )
+        with self.assertRaises(AttributeError):
+            profile.issuer = 'other'
+        self.assertIn((False, 'mobile'), self.config.verifiers)
+        self.assertIn((True, 'mobile'), self.config.verifiers)
+
+    def test_issue_claims(self):
+        """Issue 'iss', 'aud' and expiry of a profile"""
+        payload = self._decode(create_access_token('iml', profile='mobile'))
+        self.assertEqual(payload['iss'], 'https://auth.example.com')
+        self.assertEqual(payload['aud'], ['mobile', 'tablet'])
+        self.assertEqual(payload['exp'] - payload['iat'], 3600)
+
+        access, refresh = create_token_pair('iml', profile='mobile')
+        for token in (access, refresh):
+            self.assertEqual(self._decode(token)['aud'], ['mobile', 'tablet'])
+
+        payload = self._decode(create_access_token('iml'))
+        self.assertNotIn('iss', payload)
+        self.assertNotIn('aud', payload)
+
+    def test_profile_views(self):
+        """Tokens are only accepted by views of their profile"""
+        token = create_access_token('iml', profile='mobile')
+        self.assertEqual(self._get(mobile_user, token).status_code, 200)
+        response = self._get(user, token)
+        self.assertEqual(response.status_code, 401)
+        self.assertEqual(
+            json.loads(response.content), self.config.invalid_audience_msg
+        )
+
+        response = self._get(mobile_user, create_access_token('iml'))
+        self.assertEqual(response.status_code, 401)
+        self.assertEqual(
+            json.loads(response.content), self.config.invalid_issuer_msg
+        )
+
+    def test_audience_and_issuer(self):
+        """One audience in common and the same issuer are required"""
+        base = {'sub': 'iml', 'type': 'access'}
+        for claims, expected in (
+            ({'iss': 'https://auth.example.com', 'aud': 'tablet'}, None),
+            ({'iss': 'https://auth.example.com', 'aud': ['web', 'mobile']}, None),
+            ({'iss': 'https://auth.example.com', 'aud': ['web']},
+                self.config.invalid_audience_msg),
+            ({'iss': 'https://auth.example.com', 'aud': [{}]},
+                self.config.invalid_audience_msg),
+            ({'iss': 'https://auth.example.com'},
+                self.config.invalid_audience_msg),
+            ({'iss': 'https://evil.example.com', 'aud': 'mobile'},
+                self.config.invalid_issuer_msg),
+        ):
+            token = jwt.encode(dict(base, **claims), settings.SECRET_KEY, 'HS256')
+            response = self._get(mobile_user, token)
+            if expected is None:
+                self.assertEqual(response.status_code, 200)
+            else:
+                self.assertEqual(json.loads(response.content), expected)
+
+    def test_verify_in_request(self):
+        """Verify a profile outside of a decorated view"""
+        token = create_refresh_token('iml', profile='mobile')
+        request = self.factory.get(
+            '/user', HTTP_Authorization="Bearer " + token
+        )
+        with self.assertRaises(JwtVerificationError):
+            verify_jwt_in_request(request, refresh=True)
+        payload = verify_jwt_in_request(request, refresh=True, profile='mobile')
+        self.assertEqual(payload['sub'], 'iml')
+        self.assertEqual(request.jwt.profile, 'mobile')
+
+    def test_unknown_profile(self):
+        """Profiles are validated at decoration and issuance time"""
+        for profile in ('desktop', 1):
+            with self.assertRaises(InvalidProfile):
+                jwt_required(profile=profile)
+        with self.assertRaises(InvalidProfile):
+            create_access_token('iml', profile='desktop')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,149 @@
+import unittest, json, time, asyncio
+from unittest import mock
+from django.apps import apps
+from django.core.management import call_command
+from django.test import RequestFactory
+from django_jwt_extended import revoke_token, get_jwt
+from django_jwt_extended.clock import FrozenClock
+from django_jwt_extended.revocation import (
+    BloomFilter,
+    RevocationList,
+    LocalRevocationBackend,
+    CacheRevocationBackend,
+    DatabaseRevocationBackend,
+)
+from django_jwt_extended.exceptions import RevocationNotConfigured
+from tests.sample.views import login, user, async_user
+
+
+class RevocationTestCase(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        # 배포되는 migration으로 테이블 생성
+        call_command('migrate', 'django_jwt_extended', verbosity=0)
+
+    @classmethod
+    def tearDownClass(cls):
+        call_command('migrate', 'django_jwt_extended', 'zero', verbosity=0)
+
+    def setUp(self):
+        self.factory = RequestFactory()
+        self.config = apps.get_app_config('django_jwt_extended')
+        self.origin = self.config.revocation
+        response = login(self.factory.get('/login'))
+        self.access_token = json.loads(response.content)['access_token']
+
+    def tearDown(self):
+        self.config.revocation = self.origin
+
+    def _request(self):
+        return self.factory.get(
+            '/user', HTTP_Authorization="Bearer " + self.access_token
+        )
+
+    def _verified_request(self):
+        request = self._request()
+        self.assertEqual(user(request).status_code, 200)
+        return request
+
+    def _revoke_and_check(self, backend):
+        self.config.revocation = RevocationList(backend)
+        request = self._request()
+        self.assertEqual(user(request).status_code, 200)
+        revoke_token(get_jwt(request))
+        response = user(self._request())
+        self.assertEqual(response.status_code, 401)
+        self.assertEqual(
+            json.loads(response.content), self.config.revoked_token_msg
+        )
+
+    def test_local_backend(self):
+        """Revoke with in-process backend"""
+        self._revoke_and_check(LocalRevocationBackend())
+
+    def test_cache_backend(self):
+        """Revoke with Django cache backend (locmem)"""
+        self._revoke_and_check(CacheRevocationBackend(KEY_PREFIX='test'))
+
+    def test_database_backend(self):
+        """Revoke with database backend"""
+        self._revoke_and_check(DatabaseRevocationBackend())
+
+    def test_async_revoked(self):
+        """Revoked token is rejected by async views"""
+        self._revoke_and_check(LocalRevocationBackend())
+        response = asyncio.run(async_user(self._request()))
+        self.assertEqual(response.status_code, 401)
+
+    def test_revoked_within_leeway(self):
+        """Revocation outlives 'exp' by LEEWAY on the configured clock"""
+        origin = self.config.clock, self.config.leeway
+        clock = self.config.clock = FrozenClock(int(time.time()) - 3600)
+        self.config.leeway = 60
+        try:
+            for backend in (
+                LocalRevocationBackend(),
+                CacheRevocationBackend(KEY_PREFIX='leeway'),
+                DatabaseRevocationBackend(),
+            ):
+                response = json.loads(login(self.factory.get('/login')).content)
+                self.access_token = response['access_token']
+                self.config.revocation = RevocationList(
+                    backend, clock=clock, leeway=60
+                )
+                payload = get_jwt(self._verified_request())
+                revoke_token(payload)
+
+                # 만료됐지만 LEEWAY 안이므로 토큰은 유효, 폐기는 유지
+                clock.now = payload['exp'] + 30
+                response = user(self._request())
+                self.assertEqual(
+                    json.loads(response.content), self.config.revoked_token_msg
+                )
+                clock.tick(31)
+                response = user(self._request())
+                self.assertEqual(
+                    json.loads(response.content), self.config.expired_token_msg
+                )
+        finally:
+            self.config.clock, self.config.leeway = origin
+
+    def test_prefilter_skips_backend(self):
+        """Not revoked tokens never reach the backend"""
+        backend = LocalRevocationBackend()
+        revocation = RevocationList(backend, sync_interval=60)
+        revocation.revoke('revoked', time.time() + 60)
+        with mock.patch.object(backend, 'is_revoked') as is_revoked:
+            self.assertFalse(revocation.is_revoked('not-revoked'))
+            is_revoked.assert_not_called()
+
+    def test_prefilter_sync(self):
+        """Prefilter picks up revocations made by other nodes"""
+        backend = CacheRevocationBackend(KEY_PREFIX='sync')
+        node = RevocationList(backend, sync_interval=0)
+        self.assertFalse(node.is_revoked('jti'))
+        RevocationList(backend).revoke('jti', time.time() + 60)
+        self.assertTrue(node.is_revoked('jti'))
+
+    def test_bloom_filter(self):
+        """Bloom filter never misses an added jti"""
+        bloom = BloomFilter(1000, 0.01)
+        jtis = ['jti-%d' % i for i in range(1000)]
+        for jti in jtis:
+            bloom.add(jti)
+        self.assertTrue(all(jti in bloom for jti in jtis))
+        false_positives = sum(
+            'other-%d' % i in bloom for i in range(10000)
+        )
+        self.assertLess(false_positives, 300)
+
+    def test_not_configured(self):
+        """revoke_token needs a backend"""
+        self.config.revocation = None
+        with self.assertRaises(RevocationNotConfigured):
+            revoke_token({'jti': 'jti', 'exp': 0})
+
+
+if __name__ == '__main__':
+    unittest.main()
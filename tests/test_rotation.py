@@ -0,0 +1,179 @@
+import unittest, json, asyncio, time
+from unittest import mock
+import jwt
+from django.apps import apps
+from django.conf import settings
+from django.core.management import call_command
+from django.test import RequestFactory
+from django_jwt_extended.revocation import (
+    RevocationList,
+    LocalRevocationBackend,
+    DatabaseRevocationBackend,
+)
+from django_jwt_extended import (
+    refresh_token_pair,
+    verify_jwt_in_request,
+    averify_jwt_in_request,
+)
+from django_jwt_extended.exceptions import (
+    JwtVerificationError,
+    RevocationNotConfigured,
+)
+from django_jwt_extended.clock import FrozenClock
+from django_jwt_extended.rotation import rotate as rotate_family, GRACE_PERIOD
+from tests.sample.views import login_pair, rotate, refresh, user
+
+
+class RotationTestCase(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        # 배포되는 migration으로 테이블 생성
+        call_command('migrate', 'django_jwt_extended', verbosity=0)
+
+    @classmethod
+    def tearDownClass(cls):
+        call_command('migrate', 'django_jwt_extended', 'zero', verbosity=0)
+
+    def setUp(self):
+        self.factory = RequestFactory()
+        self.config = apps.get_app_config('django_jwt_extended')
+        self.origin = self.config.revocation, self.config.clock
+        self.clock = self.config.clock = FrozenClock(int(time.time()))
+        self.config.revocation = RevocationList(
+            DatabaseRevocationBackend(), clock=self.clock
+        )
+
+    def tearDown(self):
+        self.config.revocation, self.config.clock = self.origin
+
+    def _login(self):
+        return json.loads(login_pair(self.factory.get('/login')).content)
+
+    def _rotate(self, refresh_token):
+        request = self.factory.get(
+            '/rotate', HTTP_Authorization="Bearer " + refresh_token
+        )
+        return rotate(request)
+
+    def _refresh(self, refresh_token):
+        request = self.factory.get(
+            '/refresh', HTTP_Authorization="Bearer " + refresh_token
+        )
+        return refresh(request)
+
+    def _user(self, access_token):
+        request = self.factory.get(
+            '/user', HTTP_Authorization="Bearer " + access_token
+        )
+        return user(request)
+
+    def test_rotation(self):
+        """Rotate refresh tokens along a family"""
+        tokens = self._login()
+        for _ in range(3):
+            response = self._rotate(tokens['refresh_token'])
+            self.assertEqual(response.status_code, 200)
+            tokens = json.loads(response.content)
+            self.assertEqual(self._user(tokens['access_token']).status_code, 200)
+
+    def test_rotated_token_invalidated(self):
+        """Rotated refresh tokens are rejected by every refresh view"""
+        tokens = self._login()
+        rotated = json.loads(self._rotate(tokens['refresh_token']).content)
+        self.clock.tick(GRACE_PERIOD + 1)
+        response = self._refresh(tokens['refresh_token'])
+        self.assertEqual(response.status_code, 401)
+        self.assertEqual(
+            json.loads(response.content), self.config.refresh_token_reused_msg
+        )
+        # 재사용으로 family 전체가 폐기됨
+        self.assertEqual(self._refresh(rotated['refresh_token']).status_code, 401)
+        self.assertEqual(self._user(rotated['access_token']).status_code, 401)
+
+    def test_async_reuse(self):
+        """Reuse is detected by async verification"""
+        self.config.revocation = RevocationList(
+            LocalRevocationBackend(), clock=self.clock
+        )
+        refresh_token = self._login()['refresh_token']
+        payload = jwt.decode(refresh_token, settings.SECRET_KEY, ['HS256'])
+        self.config.revocation.revoke(payload['jti'], payload['exp'])
+        request = self.factory.get(
+            '/refresh', HTTP_Authorization="Bearer " + refresh_token
+        )
+        # in-memory SQLite는 스레드마다 별도의 DB이므로 감지 결과만 대체
+        with mock.patch(
+            'django_jwt_extended.rotation.detect_reuse', return_value=True
+        ) as detect_reuse:
+            with self.assertRaises(JwtVerificationError) as raised:
+                asyncio.run(averify_jwt_in_request(request, refresh=True))
+        detect_reuse.assert_called_once()
+        self.assertEqual(
+            raised.exception.msg, self.config.refresh_token_reused_msg
+        )
+
+    def test_rotation_requires_revocation(self):
+        """Old refresh tokens can only be invalidated with a backend"""
+        self.config.revocation = None
+        tokens = self._login()
+        request = self.factory.get(
+            '/rotate', HTTP_Authorization="Bearer " + tokens['refresh_token']
+        )
+        with self.assertRaises(RevocationNotConfigured):
+            refresh_token_pair(request)
+
+    def test_reuse_revokes_family(self):
+        """Reused refresh token revokes the whole family"""
+        tokens = self._login()
+        response = self._rotate(tokens['refresh_token'])
+        rotated = json.loads(response.content)
+        response = self._rotate(rotated['refresh_token'])
+        latest = json.loads(response.content)
+
+        self.clock.tick(GRACE_PERIOD + 1)
+        response = self._rotate(rotated['refresh_token'])
+        self.assertEqual(response.status_code, 401)
+        self.assertEqual(
+            json.loads(response.content), self.config.refresh_token_reused_msg
+        )
+        self.assertEqual(self._rotate(latest['refresh_token']).status_code, 401)
+        self.assertEqual(self._refresh(latest['refresh_token']).status_code, 401)
+        self.assertEqual(self._user(latest['access_token']).status_code, 401)
+
+    def test_concurrent_refresh(self):
+        """Concurrent refreshes of a token don't revoke the winner"""
+        refresh_token = self._login()['refresh_token']
+        first, second, late = (
+            self.factory.get(
+                '/rotate', HTTP_AUTHORIZATION="Bearer " + refresh_token
+            )
+            for _ in range(3)
+        )
+        # 두 요청 모두 rotation 전에 검증을 통과한 경우
+        for request in (first, second):
+            verify_jwt_in_request(request, refresh=True)
+        winner = rotate(first)
+        self.assertEqual(winner.status_code, 200)
+        for request in (second, late):
+            response = rotate(request)
+            self.assertEqual(response.status_code, 401)
+            self.assertEqual(
+                json.loads(response.content),
+                self.config.refresh_token_reused_msg,
+            )
+
+        tokens = json.loads(winner.content)
+        self.assertEqual(self._user(tokens['access_token']).status_code, 200)
+        self.assertEqual(self._rotate(tokens['refresh_token']).status_code, 200)
+
+    def test_concurrent_rotation(self):
+        """Only one of concurrent rotations of a token wins"""
+        self.assertTrue(rotate_family('root', 'root', 'a', 'x', 2 ** 40))
+        self.assertFalse(rotate_family('root', 'root', 'b', 'y', 2 ** 40))
+        self.assertTrue(rotate_family('root', 'a', 'c', 'z', 2 ** 40))
+        self.assertFalse(rotate_family('root', 'a', 'd', 'w', 2 ** 40))
+
+
+if __name__ == '__main__':
+    unittest.main()
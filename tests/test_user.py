@@ -0,0 +1,93 @@
+import unittest
+from django.apps import apps
+from django.test import RequestFactory
+from django_jwt_extended import (
+    create_access_token,
+    get_current_user,
+    user_lookup_loader,
+    invalidate_user,
+    verify_jwt_in_request,
+)
+from django_jwt_extended import tokens
+from django_jwt_extended.cache import UserCache
+from django_jwt_extended.exceptions import UserLookupNotConfigured
+
+
+class CurrentUserTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.factory = RequestFactory()
+        self.config = apps.get_app_config('django_jwt_extended')
+        self.origin = (tokens._user_lookup, self.config.user_cache)
+        self.lookups = []
+
+        @user_lookup_loader
+        def load_user(identity):
+            self.lookups.append(identity)
+            return {'username': identity} if identity != 'ghost' else None
+
+    def tearDown(self):
+        tokens._user_lookup, self.config.user_cache = self.origin
+
+    def _request(self, identity='iml'):
+        request = self.factory.get(
+            '/user',
+            HTTP_Authorization="Bearer " + create_access_token(identity),
+        )
+        verify_jwt_in_request(request)
+        return request
+
+    def test_memoized_per_request(self):
+        """User is looked up once per request"""
+        request = self._request()
+        user = get_current_user(request)
+        self.assertEqual(user, {'username': 'iml'})
+        self.assertIs(get_current_user(request), user)
+        self.assertEqual(self.lookups, ['iml'])
+
+        get_current_user(self._request())
+        self.assertEqual(self.lookups, ['iml', 'iml'])
+
+        request = self._request('ghost')
+        self.assertIsNone(get_current_user(request))
+        self.assertIsNone(get_current_user(request))
+        self.assertEqual(self.lookups, ['iml', 'iml', 'ghost'])
+
+    def test_user_cache(self):
+        """Users are cached across requests until invalidated"""
+        self.config.user_cache = UserCache(10, 60)
+        for _ in range(3):
+            get_current_user(self._request())
+        self.assertEqual(self.lookups, ['iml'])
+        self.assertEqual(self.config.user_cache.info()['hits'], 2)
+
+        invalidate_user('iml')
+        get_current_user(self._request())
+        self.assertEqual(self.lookups, ['iml', 'iml'])
+
+    def test_user_cache_expires(self):
+        """Cached users expire after the TTL"""
+        cache = UserCache(1, 60)
+        cache.set(1, 'one')
+        self.assertEqual(cache.get(1), 'one')
+        self.assertIsNone(cache.get('1'))
+        cache.set(2, 'two')
+        self.assertIsNone(cache.get(1))
+        cache._data[cache._key(2)] = ('two', 0)
+        self.assertIsNone(cache.get(2))
+
+    def test_without_token(self):
+        """No token, no user"""
+        request = self.factory.get('/user')
+        verify_jwt_in_request(request, optional=True)
+        self.assertIsNone(get_current_user(request))
+
+    def test_not_configured(self):
+        """get_current_user needs a lookup callback"""
+        tokens._user_lookup = None
+        with self.assertRaises(UserLookupNotConfigured):
+            get_current_user(self._request())
+
+
+if __name__ == '__main__':
+    unittest.main()